@@ -1,14 +1,278 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, scrolledtext
+import tkinter.font as tkfont
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import threading
+try:
+    import orjson
+except ImportError:  # Fall back to the standard library decoder/encoder
+    orjson = None
+from collections import Counter
+from contextlib import contextmanager
+from functools import partial
+from itertools import islice
+from multiprocessing.pool import ThreadPool
+import io
 import os
+import re
+import shutil
+import sys
+import tempfile
+import time
 from datetime import datetime
+from pathlib import Path
 import webbrowser
-from urllib.parse import urlparse
+import zipfile
+
+# (tag, label) pairs for heading levels, built once instead of per render
+HEADING_LEVELS = tuple((sys.intern(level), level.upper()) for level in ('h1', 'h2', 'h3', 'h4', 'h5', 'h6'))
+
+# Content quality rubric: (metric, rules) in report order. For each metric the
+# first rule whose test passes (None always passes) adds its points, which may
+# be a function of the value, and its message formatted with value and points.
+QUALITY_RUBRIC = (
+    ('title_length', (
+        (lambda v: 30 <= v <= 60, 10, "✅ Title length optimal (10/10)"),
+        (lambda v: v > 0, 5, "⚠️ Title length suboptimal (5/10)"),
+        (None, 0, "❌ Missing title (0/10)"),
+    )),
+    ('description_length', (
+        (lambda v: 120 <= v <= 160, 10, "✅ Description length optimal (10/10)"),
+        (lambda v: v > 0, 5, "⚠️ Description length suboptimal (5/10)"),
+        (None, 0, "❌ Missing description (0/10)"),
+    )),
+    ('h1_count', (
+        (lambda v: v == 1, 10, "✅ Single H1 tag (10/10)"),
+        (lambda v: v > 1, 5, "⚠️ Multiple H1 tags (5/10)"),
+        (None, 0, "❌ No H1 tag (0/10)"),
+    )),
+    ('h2_count', (
+        (lambda v: v > 0, 10, "✅ H2 tags present (10/10)"),
+        (None, 0, "❌ No H2 tags (0/10)"),
+    )),
+    ('alt_ratio', (
+        (lambda v: v is not None, lambda v: int(20 * v),
+         "📊 Image alt text coverage: {value:.1%} ({points}/20)"),
+        (None, 0, "ℹ️ No images found (N/A)"),
+    )),
+    ('internal_links', (
+        (lambda v: v > 0, 10, "✅ Internal links present (10/10)"),
+        (None, 0, "❌ No internal links (0/10)"),
+    )),
+    ('external_links', (
+        (lambda v: 0 < v <= 10, 10, "✅ Balanced external links (10/10)"),
+        (lambda v: v > 10, 5, "⚠️ Many external links (5/10)"),
+        (None, 0, "❌ No external links (0/10)"),
+    )),
+    ('word_count', (
+        (lambda v: v >= 300, 20, "✅ Sufficient content: {value:,} words (20/20)"),
+        (lambda v: v >= 100, 10, "⚠️ Limited content: {value:,} words (10/20)"),
+        (None, 0, "❌ Insufficient content: {value:,} words (0/20)"),
+    )),
+)
+
+# Minimum seconds between forced status bar redraws
+STATUS_REDRAW_INTERVAL = 1 / 30
+
+def json_loads(payload):
+    """Decode JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        try:
+            return orjson.loads(payload)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity and integers wider than 64 bits,
+            # which the standard library accepts
+            pass
+    return json.loads(payload)
+
+def ellipsize(text, limit):
+    """Cut text to limit characters, marking the cut with '...'"""
+    return text if len(text) <= limit else text[:limit] + '...'
+
+def json_dumps_truncated(obj, limit):
+    """Encode at most limit characters of indented JSON, returning (text, truncated)"""
+    encoder = json.JSONEncoder(indent=2, ensure_ascii=False)
+    chunks = []
+    size = 0
+    # iterencode yields small fragments, so stop as soon as enough text exists
+    for chunk in encoder.iterencode(obj):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size > limit:
+            return "".join(chunks)[:limit], True
+    return "".join(chunks), False
+
+class VirtualTreeview:
+    """Render only the visible window of a large item list into a flat Treeview"""
+    
+    def __init__(self, tree, scrollbar, format_row):
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.format_row = format_row
+        self.items = []
+        self.first = 0
+        self.last = 0
+        
+        # Selection and keyboard focus are kept by item index, since rows outside
+        # the window do not exist as tree items
+        self.selected = set()
+        self.focus_index = None
+        self.anchor_index = None  # Fixed end of a Shift-extended selection
+        
+        # Initial guess from the style or font; render() corrects both from a drawn row
+        style_height = ttk.Style(tree).lookup('Treeview', 'rowheight')
+        self.row_height = int(style_height) if style_height else tkfont.nametofont('TkDefaultFont').metrics('linespace')
+        self.heading_height = self.row_height
+        
+        # The scrollbar tracks the full item list, not the rows Tk actually holds
+        scrollbar.configure(command=self.yview)
+        tree.bind('<Configure>', lambda e: self.render())
+        tree.bind('<MouseWheel>', self.on_mousewheel)
+        tree.bind('<Button-4>', lambda e: self.yview('scroll', -3, 'units'))
+        tree.bind('<Button-5>', lambda e: self.yview('scroll', 3, 'units'))
+        tree.bind('<<TreeviewSelect>>', self.on_select)
+        
+        # Keyboard navigation walks the full list instead of stopping at the window edge
+        tree.bind('<Up>', lambda e: self.move_focus(-1))
+        tree.bind('<Down>', lambda e: self.move_focus(1))
+        tree.bind('<Prior>', lambda e: self.move_focus(-self.visible_count()))
+        tree.bind('<Next>', lambda e: self.move_focus(self.visible_count()))
+        tree.bind('<Home>', lambda e: self.focus_row(0))
+        tree.bind('<End>', lambda e: self.focus_row(len(self.items) - 1))
+        
+        # Shift variants extend the selection from the anchor row instead of replacing it
+        tree.bind('<Shift-Up>', lambda e: self.move_focus(-1, extend=True))
+        tree.bind('<Shift-Down>', lambda e: self.move_focus(1, extend=True))
+        tree.bind('<Shift-Prior>', lambda e: self.move_focus(-self.visible_count(), extend=True))
+        tree.bind('<Shift-Next>', lambda e: self.move_focus(self.visible_count(), extend=True))
+        tree.bind('<Shift-Home>', lambda e: self.focus_row(0, extend=True))
+        tree.bind('<Shift-End>', lambda e: self.focus_row(len(self.items) - 1, extend=True))
+    
+    def set_items(self, items):
+        """Replace the backing item list and jump back to the top"""
+        self.items = items
+        self.first = 0
+        self.selected = set()
+        self.focus_index = None
+        self.anchor_index = None
+        self.render()
+    
+    def visible_count(self):
+        """Number of rows that fit in the tree's current height"""
+        height = self.tree.winfo_height()
+        if height <= 1:  # Not mapped yet, fall back to the requested height
+            return int(self.tree.cget('height'))
+        # The column headings sit above the first row
+        return max(1, (height - self.heading_height) // self.row_height)
+    
+    def render(self):
+        """Insert the rows for the current window, replacing the previous ones"""
+        tree = self.tree
+        total = len(self.items)
+        visible = self.visible_count()
+        self.first = max(0, min(self.first, total - visible))
+        last = self.last = min(total, self.first + visible)
+        
+        children = tree.get_children()
+        if children:
+            tree.delete(*children)
+        
+        items = self.items
+        format_row = self.format_row
+        insert = tree.insert
+        for idx in range(last - 1, self.first - 1, -1):
+            insert('', 0, iid=str(idx), values=format_row(items[idx]))
+        
+        if last > self.first:
+            # Measure a drawn row; larger fonts or tk scaling make rows taller than the guess
+            bbox = tree.bbox(str(self.first))
+            if bbox and bbox[3] > 0 and (bbox[1], bbox[3]) != (self.heading_height, self.row_height):
+                self.heading_height, self.row_height = bbox[1], bbox[3]
+                self.render()
+                return
+            
+            # Restore the selection and focus that fall inside the window
+            window_selection = [str(idx) for idx in self.selected if self.first <= idx < last]
+            if window_selection:
+                tree.selection_set(window_selection)
+            if self.focus_index is not None and self.first <= self.focus_index < last:
+                tree.focus(str(self.focus_index))
+        
+        if total:
+            self.scrollbar.set(self.first / total, last / total)
+        else:
+            self.scrollbar.set(0.0, 1.0)
+    
+    def yview(self, *args):
+        """Scrollbar command: handles 'moveto' and 'scroll' requests"""
+        if not self.items:
+            return
+        if args[0] == 'moveto':
+            self.first = int(float(args[1]) * len(self.items))
+        elif args[0] == 'scroll':
+            step = int(args[1])
+            if args[2] == 'pages':
+                step *= self.visible_count()
+            self.first += step
+        self.render()
+    
+    def on_mousewheel(self, event):
+        """Scroll three rows per wheel notch"""
+        self.yview('scroll', -3 if event.delta > 0 else 3, 'units')
+        return 'break'
+    
+    def on_select(self, event):
+        """Record the selection by item index, keeping picks outside the current window"""
+        in_window = {int(iid) for iid in self.tree.selection()}
+        self.selected = {idx for idx in self.selected if not self.first <= idx < self.last} | in_window
+        focus = self.tree.focus()
+        if focus:
+            self.focus_index = int(focus)
+        # A single picked row (a plain click) becomes the anchor for Shift extension
+        if len(self.selected) == 1:
+            self.anchor_index = next(iter(self.selected))
+    
+    def move_focus(self, step, extend=False):
+        """Move the focused row by step rows, starting from the top of the window"""
+        if self.focus_index is None:
+            return self.focus_row(self.first, extend)
+        return self.focus_row(self.focus_index + step, extend)
+    
+    def focus_row(self, index, extend=False):
+        """Focus one row by item index, scrolling it into view; extend selects from the anchor to it"""
+        if not self.items:
+            return 'break'
+        index = max(0, min(index, len(self.items) - 1))
+        visible = self.visible_count()
+        if index < self.first:
+            self.first = index
+        elif index >= self.first + visible:
+            self.first = index - visible + 1
+        self.focus_index = index
+        if extend and self.anchor_index is not None:
+            low, high = sorted((self.anchor_index, index))
+            self.selected = set(range(low, high + 1))
+        else:
+            self.anchor_index = index
+            self.selected = {index}
+        self.render()
+        return 'break'
 
 class EnhancedWebScraperGUI:
+    # Cheap "looks like http(s)://host" check used while the user types
+    _URL_RE = re.compile(r'^https?://[^\s/$.?#][^\s]*$', re.IGNORECASE)
+    
+    # Quick example (label, url) pairs shown under the URL entry
+    _EXAMPLES = (
+        ("News Site", "https://news.ycombinator.com"),
+        ("E-commerce", "https://example-store.com"),
+        ("Blog", "https://medium.com"),
+        ("Documentation", "https://docs.python.org")
+    )
+    
     def __init__(self, root):
         self.root = root
         self.root.title(" Web Scraper Tool")
@@ -19,6 +283,22 @@ class EnhancedWebScraperGUI:
         self.root.minsize(1000, 700)
         # Center window on screen
         self.center_window(recommended_width, recommended_height)
+        
+        # Pooled HTTP session so repeated scrapes reuse the keep-alive connection
+        self.session = requests.Session()
+        self.session.headers.update({'Content-Type': 'application/json'})
+        adapter = HTTPAdapter(
+            pool_connections=4, pool_maxsize=8,
+            max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        )
+        # Mounted for both schemes: the Lambda endpoint and presigned S3 links may be plain http
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Set once the window starts closing; background work stops posting to Tk after that
+        self._closing = False
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        
     def center_window(self, width, height):
         screen_width = self.root.winfo_screenwidth()
         screen_height = self.root.winfo_screenheight()
@@ -32,10 +312,30 @@ class EnhancedWebScraperGUI:
         # AWS Lambda API endpoint
         self.lambda_endpoint = "EnterEndPOint"
         
-        # Data storage
+        # Debounce state for URL validation
+        self._validate_job = None
+        self._last_validated_url = None
+        
+        # Latest-wins progress update shared with the scrape worker threads
+        self._progress_lock = threading.Lock()
+        self._pending_progress = None
+        self._progress_scheduled = False
+        self._last_status_redraw = 0.0
+        
+        # Download buttons are kept across scrapes, keyed by CSV file key
+        self._dl_buttons = {}
+        
+        # Data storage; CSV files live on disk in a per-scrape temp directory
         self.scraped_data = {}
-        self.csv_files = {}
+        self.csv_paths = {}
+        self._csv_dir = None
+        
+        # Replaced directories stay on disk until no copy job still reads from them
+        self._csv_dir_jobs = Counter()
+        self._retired_csv_dirs = set()
         self.full_data = {}
+        self._raw_json_preview = ""
+        self._analysis_cache = None
         
         # Create GUI elements
         self.create_widgets()
@@ -140,16 +440,9 @@ class EnhancedWebScraperGUI:
         
         ttk.Label(examples_frame, text="Quick Examples:", font=('Arial', 9, 'bold')).pack(side=tk.LEFT)
         
-        Try = [
-            ("News Site", "https://news.ycombinator.com"),
-            ("E-commerce", "https://example-store.com"),
-            ("Blog", "https://medium.com"),
-            ("Documentation", "https://docs.python.org")
-        ]
-        
-        for label, url in Try:
+        for label, url in self._EXAMPLES:
             btn = ttk.Button(examples_frame, text=label, 
-                           command=lambda u=url: self.set_url(u),
+                           command=partial(self.set_url, url),
                            style='TButton')
             btn.pack(side=tk.LEFT, padx=5)
             
@@ -209,15 +502,63 @@ class EnhancedWebScraperGUI:
         self.notebook = ttk.Notebook(results_frame)
         self.notebook.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         
-        # Create tabs
+        # Summary tab is shown first, so build it up front
         self.create_summary_tab()
-        self.create_seo_tab()
-        self.create_content_tab()
-        self.create_links_tab()
-        self.create_images_tab()
-        self.create_tables_tab()
-        self.create_structured_data_tab()
-        self.create_raw_data_tab()
+        
+        # Remaining tabs get an empty frame now; their widgets are built on first use
+        self._tab_builders = {}
+        self._tab_built = set()
+        self.seo_frame = self.add_lazy_tab("🔍 SEO Analysis", self.create_seo_tab)
+        self.content_frame = self.add_lazy_tab("📝 Content", self.create_content_tab)
+        self.links_frame = self.add_lazy_tab("🔗 Links", self.create_links_tab)
+        self.images_frame = self.add_lazy_tab("🖼️ Images", self.create_images_tab)
+        self.tables_frame = self.add_lazy_tab("📊 Tables", self.create_tables_tab)
+        self.structured_frame = self.add_lazy_tab("🏗️ Structured Data", self.create_structured_data_tab)
+        self.raw_frame = self.add_lazy_tab("🔧 Raw Data", self.create_raw_data_tab)
+        
+        # Results are rendered into a tab the first time it is shown after each scrape
+        self._tab_renderers = {
+            str(self.seo_frame): self.display_seo_analysis,
+            str(self.content_frame): self.display_content_analysis,
+            str(self.links_frame): self.display_links_analysis,
+            str(self.images_frame): self.display_images_analysis,
+            str(self.tables_frame): self.display_tables_analysis,
+            str(self.structured_frame): self.display_structured_data,
+            str(self.raw_frame): self.display_raw_data,
+        }
+        self._rendered_tabs = set()
+        
+        self.notebook.bind('<<NotebookTabChanged>>', self.on_tab_changed)
+        
+    def add_lazy_tab(self, text, builder):
+        """Add a placeholder tab whose widgets are created by builder on first use"""
+        frame = ttk.Frame(self.notebook, padding="10")
+        self.notebook.add(frame, text=text)
+        self._tab_builders[str(frame)] = builder
+        return frame
+        
+    def ensure_tab_built(self, frame):
+        """Build a lazy tab's widgets if they do not exist yet"""
+        tab_id = str(frame)
+        if tab_id in self._tab_built or tab_id not in self._tab_builders:
+            return
+        self._tab_built.add(tab_id)
+        self._tab_builders[tab_id]()
+        
+    def on_tab_changed(self, event=None):
+        """Build and render the selected tab the first time it is shown"""
+        tab_id = self.notebook.select()
+        self.ensure_tab_built(tab_id)
+        self.render_tab(tab_id)
+        
+    def render_tab(self, tab_id):
+        """Fill a results tab from the current scrape unless it is already up to date"""
+        if not self.scraped_data or tab_id in self._rendered_tabs:
+            return
+        renderer = self._tab_renderers.get(str(tab_id))
+        if renderer is not None:
+            self._rendered_tabs.add(str(tab_id))
+            renderer()
         
     def create_summary_tab(self):
         """Create summary overview tab"""
@@ -232,9 +573,6 @@ class EnhancedWebScraperGUI:
         
     def create_seo_tab(self):
         """Create SEO analysis tab"""
-        self.seo_frame = ttk.Frame(self.notebook, padding="10")
-        self.notebook.add(self.seo_frame, text="🔍 SEO Analysis")
-        
         self.seo_text = scrolledtext.ScrolledText(
             self.seo_frame, height=20, width=80, wrap=tk.WORD,
             font=('Courier', 10)
@@ -243,9 +581,6 @@ class EnhancedWebScraperGUI:
         
     def create_content_tab(self):
         """Create content analysis tab"""
-        self.content_frame = ttk.Frame(self.notebook, padding="10")
-        self.notebook.add(self.content_frame, text="📝 Content")
-        
         # Create treeview for structured content display
         columns = ('Type', 'Count', 'Details')
         self.content_tree = ttk.Treeview(self.content_frame, columns=columns, show='tree headings', height=15)
@@ -272,9 +607,6 @@ class EnhancedWebScraperGUI:
         
     def create_links_tab(self):
         """Create links analysis tab"""
-        self.links_frame = ttk.Frame(self.notebook, padding="10")
-        self.notebook.add(self.links_frame, text="🔗 Links")
-        
         # Links summary frame
         links_summary_frame = ttk.Frame(self.links_frame)
         links_summary_frame.pack(fill=tk.X, pady=(0, 10))
@@ -291,9 +623,10 @@ class EnhancedWebScraperGUI:
             self.links_tree.column(col, width=150 if col != 'URL' else 300)
         
         # Scrollbars for links tree
-        links_scrollbar_y = ttk.Scrollbar(self.links_frame, orient=tk.VERTICAL, command=self.links_tree.yview)
+        links_scrollbar_y = ttk.Scrollbar(self.links_frame, orient=tk.VERTICAL)
         links_scrollbar_x = ttk.Scrollbar(self.links_frame, orient=tk.HORIZONTAL, command=self.links_tree.xview)
-        self.links_tree.configure(yscrollcommand=links_scrollbar_y.set, xscrollcommand=links_scrollbar_x.set)
+        self.links_tree.configure(xscrollcommand=links_scrollbar_x.set)
+        self.links_view = VirtualTreeview(self.links_tree, links_scrollbar_y, self.format_link_row)
         
         self.links_tree.pack(fill=tk.BOTH, expand=True)
         links_scrollbar_y.pack(side=tk.RIGHT, fill=tk.Y)
@@ -301,9 +634,6 @@ class EnhancedWebScraperGUI:
         
     def create_images_tab(self):
         """Create images analysis tab"""
-        self.images_frame = ttk.Frame(self.notebook, padding="10")
-        self.notebook.add(self.images_frame, text="🖼️ Images")
-        
         # Images summary
         images_summary_frame = ttk.Frame(self.images_frame)
         images_summary_frame.pack(fill=tk.X, pady=(0, 10))
@@ -320,9 +650,10 @@ class EnhancedWebScraperGUI:
             self.images_tree.column(col, width=120 if col != 'Source URL' else 300)
         
         # Scrollbars for images tree
-        images_scrollbar_y = ttk.Scrollbar(self.images_frame, orient=tk.VERTICAL, command=self.images_tree.yview)
+        images_scrollbar_y = ttk.Scrollbar(self.images_frame, orient=tk.VERTICAL)
         images_scrollbar_x = ttk.Scrollbar(self.images_frame, orient=tk.HORIZONTAL, command=self.images_tree.xview)
-        self.images_tree.configure(yscrollcommand=images_scrollbar_y.set, xscrollcommand=images_scrollbar_x.set)
+        self.images_tree.configure(xscrollcommand=images_scrollbar_x.set)
+        self.images_view = VirtualTreeview(self.images_tree, images_scrollbar_y, self.format_image_row)
         
         self.images_tree.pack(fill=tk.BOTH, expand=True)
         images_scrollbar_y.pack(side=tk.RIGHT, fill=tk.Y)
@@ -330,9 +661,6 @@ class EnhancedWebScraperGUI:
         
     def create_tables_tab(self):
         """Create tables analysis tab"""
-        self.tables_frame = ttk.Frame(self.notebook, padding="10")
-        self.notebook.add(self.tables_frame, text="📊 Tables")
-        
         self.tables_text = scrolledtext.ScrolledText(
             self.tables_frame, height=20, width=80, wrap=tk.WORD,
             font=('Courier', 10)
@@ -341,9 +669,6 @@ class EnhancedWebScraperGUI:
         
     def create_structured_data_tab(self):
         """Create structured data tab"""
-        self.structured_frame = ttk.Frame(self.notebook, padding="10")
-        self.notebook.add(self.structured_frame, text="🏗️ Structured Data")
-        
         self.structured_text = scrolledtext.ScrolledText(
             self.structured_frame, height=20, width=80, wrap=tk.WORD,
             font=('Courier', 10)
@@ -352,9 +677,6 @@ class EnhancedWebScraperGUI:
         
     def create_raw_data_tab(self):
         """Create raw data tab"""
-        self.raw_frame = ttk.Frame(self.notebook, padding="10")
-        self.notebook.add(self.raw_frame, text="🔧 Raw Data")
-        
         self.raw_text = scrolledtext.ScrolledText(
             self.raw_frame, height=20, width=80, wrap=tk.WORD,
             font=('Courier', 9)
@@ -374,11 +696,12 @@ class EnhancedWebScraperGUI:
         
         # Responsive scrollable download buttons frame (horizontal and vertical)
         canvas = tk.Canvas(download_frame, height=100)
+        self.download_canvas = canvas
+        self._bbox_job = None
         h_scroll = ttk.Scrollbar(download_frame, orient=tk.HORIZONTAL, command=canvas.xview)
         v_scroll = ttk.Scrollbar(download_frame, orient=tk.VERTICAL, command=canvas.yview)
         self.download_buttons_frame = ttk.Frame(canvas)
-        self.download_buttons_frame.bind(
-            "<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
+        self.download_buttons_frame.bind("<Configure>", self.schedule_scrollregion_update)
         canvas.create_window((0, 0), window=self.download_buttons_frame, anchor="nw")
         canvas.configure(xscrollcommand=h_scroll.set, yscrollcommand=v_scroll.set)
         canvas.grid(row=1, column=0, sticky=(tk.N, tk.S, tk.E, tk.W))
@@ -408,6 +731,17 @@ class EnhancedWebScraperGUI:
         
         self.download_folder = None
         
+    def schedule_scrollregion_update(self, event=None):
+        """Recompute the download canvas scroll region once a burst of resizes settles"""
+        if self._bbox_job:
+            self.root.after_cancel(self._bbox_job)
+        self._bbox_job = self.root.after(50, self.update_scrollregion)
+        
+    def update_scrollregion(self):
+        """Fit the download canvas scroll region to its buttons"""
+        self._bbox_job = None
+        self.download_canvas.configure(scrollregion=self.download_canvas.bbox("all"))
+        
     def create_status_bar(self):
         """Create status bar"""
         self.status_bar = ttk.Label(self.main_frame, text="Ready to scrape websites...", 
@@ -415,24 +749,30 @@ class EnhancedWebScraperGUI:
         self.status_bar.grid(row=6, column=0, sticky=(tk.W, tk.E), pady=(0, 5))
         
     def validate_url(self, event=None):
+        """Schedule URL validation once typing pauses"""
+        if self._validate_job:
+            self.root.after_cancel(self._validate_job)
+        self._validate_job = self.root.after(200, self._do_validate_url)
+    
+    def _do_validate_url(self):
         """Validate URL format"""
+        self._validate_job = None
         url = self.url_entry.get().strip()
+        if url == self._last_validated_url:
+            return
+        self._last_validated_url = url
+        
         if not url or url == "https://":
             self.url_status_label.config(text="", foreground=self.colors['fg'])
             return
             
-        try:
-            if not url.startswith(('http://', 'https://')):
-                url = 'https://' + url
-            
-            parsed = urlparse(url)
-            if parsed.netloc:
-                self.url_status_label.config(text="✅ Valid URL format", 
-                                           foreground=self.colors['success'])
-            else:
-                self.url_status_label.config(text="⚠️ Invalid URL format", 
-                                           foreground=self.colors['error'])
-        except:
+        if not url.startswith(('http://', 'https://')):
+            url = 'https://' + url
+        
+        if self._URL_RE.match(url):
+            self.url_status_label.config(text="✅ Valid URL format", 
+                                       foreground=self.colors['success'])
+        else:
             self.url_status_label.config(text="⚠️ Invalid URL format", 
                                        foreground=self.colors['error'])
     
@@ -463,9 +803,7 @@ class EnhancedWebScraperGUI:
         
         # Start scraping in separate thread
         self.scraping_start_time = datetime.now()
-        thread = threading.Thread(target=self.scrape_website, args=(url,))
-        thread.daemon = True
-        thread.start()
+        self.run_in_background(self.scrape_website, url)
         
     def scrape_website(self, url):
         """Scrape website using enhanced Lambda function"""
@@ -478,30 +816,44 @@ class EnhancedWebScraperGUI:
             self.update_progress(30, "📤 Sending scraping request...")
             
             # Make request to Lambda function
-            response = requests.post(
+            response = self.session.post(
                 self.lambda_endpoint,
                 json=payload,
-                headers={'Content-Type': 'application/json'},
-                timeout=120  # Increased timeout for comprehensive scraping
+                timeout=(10, 120)  # Connect / read timeout for comprehensive scraping
             )
             
             self.update_progress(70, "⚙️ Processing comprehensive data...")
             
             if response.status_code == 200:
-                data = response.json()
+                # Decode straight from the body bytes and release the response
+                # so the raw payload is not kept alive next to the parsed dict
+                data = json_loads(response.content)
+                response.close()
+                del response
                 
                 if data.get('success'):
-                    # Store all data
-                    self.scraped_data = data.get('data', {})
-                    self.csv_files = data.get('csv_files', {})
-                    self.full_data = data.get('full_data', {})
+                    # Take ownership of each section so the envelope dict can be freed
+                    self.scraped_data = data.pop('data', {})
+                    self._analysis_cache = None
+                    csv_files = data.pop('csv_files', None)
+                    if csv_files is None:
+                        # The server staged the CSVs in S3 and sent an archive link instead
+                        csv_files = self.fetch_csv_archive(data.pop('csv_archive_url', None))
+                    self.store_csv_files(csv_files)
+                    self.full_data = data.pop('full_data', None)
+                    if self.full_data is None:
+                        self.full_data = self.fetch_full_data(data.pop('full_data_url', None))
+                    data.clear()
+                    self.intern_repeated_values(self.full_data)
+                    self._raw_json_preview = self.build_raw_json_preview()
                     
-                    # Display results in GUI
-                    self.root.after(0, self.display_comprehensive_results)
+                    # Render the summary first, then the heavier tabs
+                    self.post_to_ui(self.display_summary)
+                    self.post_to_ui(self.display_comprehensive_results)
                     
                     # Enable buttons
-                    self.root.after(0, lambda: self.analyze_button.config(state=tk.NORMAL))
-                    self.root.after(0, lambda: self.download_all_button.config(state=tk.NORMAL))
+                    self.post_to_ui(self.analyze_button.config, {'state': tk.NORMAL})
+                    self.post_to_ui(self.download_all_button.config, {'state': tk.NORMAL})
                     
                     # Update progress
                     elapsed_time = datetime.now() - self.scraping_start_time
@@ -509,52 +861,114 @@ class EnhancedWebScraperGUI:
                     
                 else:
                     error_msg = data.get('error', 'Unknown error occurred')
-                    self.root.after(0, lambda: messagebox.showerror("Error", f"Scraping failed: {error_msg}"))
+                    self.post_to_ui(messagebox.showerror, "Error", f"Scraping failed: {error_msg}")
                     self.update_progress(0, "❌ Scraping failed")
             else:
-                self.root.after(0, lambda: messagebox.showerror("Error", f"Server error: {response.status_code}\n{response.text}"))
+                self.post_to_ui(messagebox.showerror, "Error", f"Server error: {response.status_code}\n{response.text}")
                 self.update_progress(0, "❌ Server error")
                 
         except requests.exceptions.Timeout:
-            self.root.after(0, lambda: messagebox.showerror("Error", "Request timed out. The website might be slow to respond."))
+            self.post_to_ui(messagebox.showerror, "Error", "Request timed out. The website might be slow to respond.")
             self.update_progress(0, "⏱️ Request timeout")
         except requests.exceptions.RequestException as e:
-            self.root.after(0, lambda: messagebox.showerror("Error", f"Network error: {str(e)}"))
+            self.post_to_ui(messagebox.showerror, "Error", f"Network error: {str(e)}")
             self.update_progress(0, "🌐 Network error")
         except Exception as e:
-            self.root.after(0, lambda: messagebox.showerror("Error", f"Unexpected error: {str(e)}"))
+            self.post_to_ui(messagebox.showerror, "Error", f"Unexpected error: {str(e)}")
             self.update_progress(0, "❌ Unexpected error")
         finally:
-            self.root.after(0, lambda: self.scrape_button.config(state=tk.NORMAL))
+            self.post_to_ui(self.scrape_button.config, {'state': tk.NORMAL})
             
+    def fetch_full_data(self, full_data_url):
+        """Download the full extraction data staged in S3 by the Lambda"""
+        if not full_data_url:
+            return {}
+        response = self.session.get(full_data_url, timeout=(10, 60))
+        response.raise_for_status()
+        full_data = json_loads(response.content)
+        response.close()
+        return full_data
+    
+    def fetch_csv_archive(self, csv_archive_url):
+        """Download the ZIP of CSV files staged in S3 by the Lambda, keyed like the inline csv_files"""
+        if not csv_archive_url:
+            return {}
+        response = self.session.get(csv_archive_url, timeout=(10, 60))
+        response.raise_for_status()
+        with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+            csv_files = {os.path.splitext(name)[0]: archive.read(name).decode('utf-8') for name in archive.namelist()}
+        response.close()
+        return csv_files
+    
+    def store_csv_files(self, csv_files):
+        """Write the scraped CSV files to a fresh temp directory and hand it to the Tk thread"""
+        csv_dir = tempfile.mkdtemp(prefix='web_scraper_')
+        csv_paths = {}
+        
+        while csv_files:
+            file_key, csv_content = csv_files.popitem()
+            if csv_content:
+                path = os.path.join(csv_dir, f"{file_key}.csv")
+                with open(path, 'w', encoding='utf-8') as f:
+                    f.write(csv_content)
+                csv_paths[file_key] = path
+        
+        # popitem() drains in reverse, so restore the server's ordering
+        self.post_to_ui(self.swap_csv_dir, dict(reversed(csv_paths.items())), csv_dir)
+        if self._closing:  # on_close has already cleaned up, so the swap may never run
+            shutil.rmtree(csv_dir, ignore_errors=True)
+    
+    def swap_csv_dir(self, csv_paths, csv_dir):
+        """Make csv_dir the current CSV directory and retire the previous one"""
+        self.csv_paths = csv_paths
+        self.retire_csv_dir()
+        self._csv_dir = csv_dir
+    
+    def retire_csv_dir(self):
+        """Stop offering the current CSV directory and delete it once no copy job uses it"""
+        if self._csv_dir:
+            self._retired_csv_dirs.add(self._csv_dir)
+            self._csv_dir = None
+        self.remove_unused_csv_dirs()
+    
+    def remove_unused_csv_dirs(self):
+        """Delete retired CSV directories that no copy job is still reading"""
+        for csv_dir in [d for d in self._retired_csv_dirs if not self._csv_dir_jobs[d]]:
+            shutil.rmtree(csv_dir, ignore_errors=True)
+            self._retired_csv_dirs.discard(csv_dir)
+            del self._csv_dir_jobs[csv_dir]
+    
+    def release_csv_dir(self, csv_dir):
+        """Record that a copy job reading from csv_dir has finished"""
+        self._csv_dir_jobs[csv_dir] -= 1
+        self.remove_unused_csv_dirs()
+    
+    @staticmethod
+    def intern_repeated_values(full_data):
+        """Share one string object for small values repeated on every record"""
+        for heading in full_data.get('headings', []):
+            level = heading.get('level')
+            if level:
+                heading['level'] = sys.intern(level)
+        for link in full_data.get('links', []):
+            for key in ('target', 'rel'):
+                value = link.get(key)
+                if value:
+                    link[key] = sys.intern(value)
+        for img in full_data.get('images', []):
+            loading = img.get('loading')
+            if loading:
+                img['loading'] = sys.intern(loading)
+        
     def display_comprehensive_results(self):
         """Display comprehensive scraping results"""
         if not self.scraped_data:
             return
             
-        # Display summary
-        self.display_summary()
-        
-        # Display SEO analysis
-        self.display_seo_analysis()
-        
-        # Display content analysis
-        self.display_content_analysis()
-        
-        # Display links
-        self.display_links_analysis()
-        
-        # Display images
-        self.display_images_analysis()
-        
-        # Display tables
-        self.display_tables_analysis()
-        
-        # Display structured data
-        self.display_structured_data()
-        
-        # Display raw data
-        self.display_raw_data()
+        # Only the visible tab is rendered now (summary is rendered ahead of this
+        # call); the others are filled in by on_tab_changed when first selected
+        self._rendered_tabs.clear()
+        self.render_tab(self.notebook.select())
         
         # Update download section
         self.update_download_section()
@@ -562,61 +976,66 @@ class EnhancedWebScraperGUI:
     def display_summary(self):
         """Display website summary"""
         data = self.scraped_data
-        seo_summary = data.get('seo_summary', {})
+        get = data.get
+        seo_get = get('seo_summary', {}).get
+        
+        description = get('description', 'N/A')
+        page_size = get('page_size_bytes', 0)
+        truncated_note = ", truncated" if get('page_truncated') else ""
         
-        summary = f"""🌐 WEBSITE ANALYSIS SUMMARY
+        parts = [f"""🌐 WEBSITE ANALYSIS SUMMARY
 {'='*60}
 
 📊 BASIC INFORMATION:
-URL: {data.get('url', 'N/A')}
-Title: {data.get('title', 'N/A')}
-Description: {data.get('description', 'N/A')[:200]}{'...' if len(data.get('description', '')) > 200 else ''}
+URL: {get('url', 'N/A')}
+Title: {get('title', 'N/A')}
+Description: {ellipsize(description, 200)}
 
 📈 CONTENT STATISTICS:
-• Word Count: {data.get('word_count', 0):,} words
-• Page Size: {data.get('page_size_bytes', 0):,} bytes ({data.get('page_size_bytes', 0)/1024:.1f} KB)
-• Total Headings: {data.get('total_headings', 0)}
-• Total Links: {data.get('total_links', 0)}
-• Total Images: {data.get('total_images', 0)}
-• Total Tables: {data.get('total_tables', 0)}
+• Word Count: {get('word_count', 0):,} words
+• Page Size: {page_size:,} bytes ({page_size/1024:.1f} KB{truncated_note})
+• Total Headings: {get('total_headings', 0)}
+• Total Links: {get('total_links', 0)}
+• Total Images: {get('total_images', 0)}
+• Total Tables: {get('total_tables', 0)}
 
 📋 HEADING BREAKDOWN:
-"""
+"""]
         
-        heading_hierarchy = data.get('heading_hierarchy', {})
-        for level in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
+        heading_hierarchy = get('heading_hierarchy', {})
+        for level, label in HEADING_LEVELS:
             count = heading_hierarchy.get(level, 0)
             if count > 0:
-                summary += f"• {level.upper()}: {count}\n"
+                parts.append(f"• {label}: {count}\n")
         
-        summary += f"""
+        parts.append(f"""
 🔗 LINK ANALYSIS:
-• Internal Links: {seo_summary.get('internal_links', 0)}
-• External Links: {seo_summary.get('external_links', 0)}
+• Internal Links: {seo_get('internal_links', 0)}
+• External Links: {seo_get('external_links', 0)}
 
 🖼️ IMAGE ANALYSIS:
-• Images without Alt Text: {seo_summary.get('images_without_alt', 0)}
+• Images without Alt Text: {seo_get('images_without_alt', 0)}
 
 📄 SEO METRICS:
-• Title Length: {seo_summary.get('title_length', 0)} characters
-• Description Length: {seo_summary.get('description_length', 0)} characters
+• Title Length: {seo_get('title_length', 0)} characters
+• Description Length: {seo_get('description_length', 0)} characters
 
-📅 SCRAPED: {data.get('scraped_at', 'N/A')}
+📅 SCRAPED: {get('scraped_at', 'N/A')}
 
-🗂️ AVAILABLE DATA FILES: {len(self.csv_files)} files ready for download
-"""
+🗂️ AVAILABLE DATA FILES: {len(self.csv_paths)} files ready for download
+""")
         
-        self.summary_text.delete(1.0, tk.END)
-        self.summary_text.insert(1.0, summary)
+        self.set_text(self.summary_text, "".join(parts))
         
     def display_seo_analysis(self):
         """Display SEO analysis"""
+        self.ensure_tab_built(self.seo_frame)
         if not self.full_data or 'seo_data' not in self.full_data:
             return
             
         seo_data = self.full_data['seo_data']
         
-        seo_analysis = f"""🔍 SEO ANALYSIS REPORT
+        parts = [f"""🔍 SEO ANALYSIS REPORT
 {'='*50}
 
 📝 META INFORMATION:
@@ -628,14 +1047,15 @@ Robots: {seo_data.get('robots', 'Not specified')}
 Language: {seo_data.get('lang', 'Not specified')}
 
 📊 HEADING STRUCTURE:
-"""
+"""]
         
         heading_structure = seo_data.get('heading_structure', {})
-        for level, count in heading_structure.items():
+        for level, label in HEADING_LEVELS:
+            count = heading_structure.get(level, 0)
             if count > 0:
-                seo_analysis += f"• {level.upper()}: {count}\n"
+                parts.append(f"• {label}: {count}\n")
         
-        seo_analysis += f"""
+        parts.append(f"""
 🔗 LINK METRICS:
 • Internal Links: {seo_data.get('internal_links', 0)}
 • External Links: {seo_data.get('external_links', 0)}
@@ -649,238 +1069,270 @@ Language: {seo_data.get('lang', 'Not specified')}
 • Prefetch Resources: {seo_data.get('page_load_hints', {}).get('prefetch', 0)}
 
 🌐 INTERNATIONALIZATION:
-"""
+""")
         
         hreflang = seo_data.get('hreflang', [])
         if hreflang:
-            seo_analysis += f"• Hreflang Links: {len(hreflang)}\n"
-            for hl in hreflang[:5]:  # Show first 5
-                seo_analysis += f"  - {hl.get('hreflang', 'N/A')}: {hl.get('href', 'N/A')}\n"
+            parts.append(f"• Hreflang Links: {len(hreflang)}\n")
+            for hl in islice(hreflang, 5):  # Show first 5
+                parts.append(f"  - {hl.get('hreflang', 'N/A')}: {hl.get('href', 'N/A')}\n")
         else:
-            seo_analysis += "• No hreflang tags found\n"
+            parts.append("• No hreflang tags found\n")
         
         # SEO recommendations
-        seo_analysis += f"""
+        parts.append("""
 🎯 SEO RECOMMENDATIONS:
-"""
+""")
         
         # Title analysis
         title_length = len(seo_data.get('title_tag', ''))
         if title_length == 0:
-            seo_analysis += "❌ Missing title tag\n"
+            parts.append("❌ Missing title tag\n")
         elif title_length < 30:
-            seo_analysis += "⚠️ Title tag too short (< 30 characters)\n"
+            parts.append("⚠️ Title tag too short (< 30 characters)\n")
         elif title_length > 60:
-            seo_analysis += "⚠️ Title tag too long (> 60 characters)\n"
+            parts.append("⚠️ Title tag too long (> 60 characters)\n")
         else:
-            seo_analysis += "✅ Title tag length is optimal\n"
+            parts.append("✅ Title tag length is optimal\n")
         
         # Description analysis
         desc_length = len(seo_data.get('meta_description', ''))
         if desc_length == 0:
-            seo_analysis += "❌ Missing meta description\n"
+            parts.append("❌ Missing meta description\n")
         elif desc_length < 120:
-            seo_analysis += "⚠️ Meta description too short (< 120 characters)\n"
+            parts.append("⚠️ Meta description too short (< 120 characters)\n")
         elif desc_length > 160:
-            seo_analysis += "⚠️ Meta description too long (> 160 characters)\n"
+            parts.append("⚠️ Meta description too long (> 160 characters)\n")
         else:
-            seo_analysis += "✅ Meta description length is optimal\n"
+            parts.append("✅ Meta description length is optimal\n")
         
         # H1 analysis
         h1_count = heading_structure.get('h1', 0)
         if h1_count == 0:
-            seo_analysis += "❌ No H1 tag found\n"
+            parts.append("❌ No H1 tag found\n")
         elif h1_count > 1:
-            seo_analysis += "⚠️ Multiple H1 tags found (not recommended)\n"
+            parts.append("⚠️ Multiple H1 tags found (not recommended)\n")
         else:
-            seo_analysis += "✅ Single H1 tag found\n"
+            parts.append("✅ Single H1 tag found\n")
         
         # Image alt text analysis
         images_without_alt = seo_data.get('images_without_alt', 0)
         if images_without_alt > 0:
-            seo_analysis += f"⚠️ {images_without_alt} images missing alt text\n"
+            parts.append(f"⚠️ {images_without_alt} images missing alt text\n")
         else:
-            seo_analysis += "✅ All images have alt text\n"
+            parts.append("✅ All images have alt text\n")
         
-        self.seo_text.delete(1.0, tk.END)
-        self.seo_text.insert(1.0, seo_analysis)
+        self.set_text(self.seo_text, "".join(parts))
         
     def display_content_analysis(self):
         """Display content structure analysis"""
+        self.ensure_tab_built(self.content_frame)
         if not self.full_data:
             return
+        
+        # Look up each section of the payload once
+        full_data = self.full_data
+        content_data = full_data.get('content_data') or {}
+        structured = full_data.get('structured_data') or {}
             
-        # Clear previous content
-        for item in self.content_tree.get_children():
-            self.content_tree.delete(item)
-        
-        # Add heading structure
-        headings = self.full_data.get('headings', [])
-        if headings:
-            heading_node = self.content_tree.insert('', 'end', text='Headings', 
-                                                   values=('Structure', len(headings), 'Page heading hierarchy'))
+        # Clear previous content and rebuild the tree with its columns hidden
+        with self.frozen_tree(self.content_tree) as insert:
+            # Add heading structure
+            headings = full_data.get('headings', [])
+            if headings:
+                heading_node = insert('', 'end', text='Headings', 
+                                      values=('Structure', len(headings), 'Page heading hierarchy'))
             
-            current_level = {}
-            for heading in headings[:20]:  # Show first 20 headings
-                level = heading.get('level', 'h1')
-                text = heading.get('text', '')[:50] + ('...' if len(heading.get('text', '')) > 50 else '')
+                current_level = {}
+                for heading in reversed(headings[:20]):  # Show first 20 headings
+                    level = heading.get('level', 'h1')
+                    text = ellipsize(heading.get('text', ''), 50)
                 
-                self.content_tree.insert(heading_node, 'end', text=f"{level.upper()}: {text}",
-                                       values=(level, '', heading.get('id', 'No ID')))
-        
-        # Add content data
-        content_data = self.full_data.get('content_data', {})
-        
-        # Navigation
-        navigation = content_data.get('navigation', [])
-        if navigation:
-            nav_node = self.content_tree.insert('', 'end', text='Navigation', 
-                                              values=('Structure', len(navigation), 'Site navigation elements'))
-            for i, nav_items in enumerate(navigation[:5]):
-                nav_text = f"Nav Menu {i+1} ({len(nav_items)} items)"
-                self.content_tree.insert(nav_node, 'end', text=nav_text,
-                                       values=('Navigation', len(nav_items), 'Menu items'))
-        
-        # Lists
-        lists = content_data.get('lists', [])
-        if lists:
-            lists_node = self.content_tree.insert('', 'end', text='Lists', 
-                                                 values=('Content', len(lists), 'Structured list content'))
-            for i, list_item in enumerate(lists[:10]):
-                list_text = f"{list_item.get('type', 'ul').upper()} List {i+1}"
-                item_count = len(list_item.get('items', []))
-                self.content_tree.insert(lists_node, 'end', text=list_text,
-                                       values=(list_item.get('type', 'ul'), item_count, f'{item_count} items'))
-        
-        # Forms
-        forms = self.full_data.get('structured_data', {}).get('forms', [])
-        if forms:
-            forms_node = self.content_tree.insert('', 'end', text='Forms', 
-                                                 values=('Interactive', len(forms), 'Web forms'))
-            for i, form in enumerate(forms):
-                form_text = f"Form {i+1} ({form.get('method', 'GET')})"
-                input_count = len(form.get('inputs', []))
-                self.content_tree.insert(forms_node, 'end', text=form_text,
-                                       values=(form.get('method', 'GET'), input_count, f'{input_count} inputs'))
-        
-        # Media
-        media_list = self.full_data.get('structured_data', {}).get('media', [])
-        if media_list:
-            media_node = self.content_tree.insert('', 'end', text='Media Elements', 
-                                                 values=('Media', len(media_list), 'Video, audio, iframe elements'))
+                    insert(heading_node, 0, text=f"{level.upper()}: {text}",
+                           values=(level, '', heading.get('id', 'No ID')))
+        
+            # Navigation
+            navigation = content_data.get('navigation', [])
+            if navigation:
+                nav_node = insert('', 'end', text='Navigation', 
+                                  values=('Structure', len(navigation), 'Site navigation elements'))
+                for i, nav_items in reversed(list(enumerate(navigation[:5]))):
+                    nav_text = f"Nav Menu {i+1} ({len(nav_items)} items)"
+                    insert(nav_node, 0, text=nav_text,
+                           values=('Navigation', len(nav_items), 'Menu items'))
+        
+            # Lists
+            lists = content_data.get('lists', [])
+            if lists:
+                lists_node = insert('', 'end', text='Lists', 
+                                    values=('Content', len(lists), 'Structured list content'))
+                for i, list_item in reversed(list(enumerate(lists[:10]))):
+                    list_text = f"{list_item.get('type', 'ul').upper()} List {i+1}"
+                    item_count = len(list_item.get('items', []))
+                    insert(lists_node, 0, text=list_text,
+                           values=(list_item.get('type', 'ul'), item_count, f'{item_count} items'))
+        
+            # Forms
+            forms = structured.get('forms', [])
+            if forms:
+                forms_node = insert('', 'end', text='Forms', 
+                                    values=('Interactive', len(forms), 'Web forms'))
+                for i, form in reversed(list(enumerate(forms))):
+                    form_text = f"Form {i+1} ({form.get('method', 'GET')})"
+                    input_count = len(form.get('inputs', []))
+                    insert(forms_node, 0, text=form_text,
+                           values=(form.get('method', 'GET'), input_count, f'{input_count} inputs'))
+        
+            # Media
+            media_list = structured.get('media', [])
+            if media_list:
+                media_node = insert('', 'end', text='Media Elements', 
+                                    values=('Media', len(media_list), 'Video, audio, iframe elements'))
+        
+        # Tokenize the page text once and reuse it for every statistic
+        text_content = full_data.get('text_content', '')
+        text_length = len(text_content)
+        word_count = len(text_content.split())
+        sample = text_content[:1000] if 'text_content' in full_data else 'No content available'
         
         # Display detailed content in text area
-        content_details = f"""📝 DETAILED CONTENT ANALYSIS
+        parts = [f"""📝 DETAILED CONTENT ANALYSIS
 {'='*40}
 
 💬 TEXT CONTENT SAMPLE:
-{self.full_data.get('text_content', 'No content available')[:1000]}
-{'...' if len(self.full_data.get('text_content', '')) > 1000 else ''}
+{sample}
+{'...' if text_length > 1000 else ''}
 
 📊 CONTENT STATISTICS:
-• Total Characters: {len(self.full_data.get('text_content', ''))}
-• Estimated Reading Time: {len(self.full_data.get('text_content', '').split()) // 250} minutes
-• Word Count: {len(self.full_data.get('text_content', '').split())} words
+• Total Characters: {text_length}
+• Estimated Reading Time: {word_count // 250} minutes
+• Word Count: {word_count} words
 
 🔍 CODE BLOCKS FOUND:
-"""
+"""]
         
         code_blocks = content_data.get('code_blocks', [])
         if code_blocks:
-            for i, code in enumerate(code_blocks[:5]):
-                content_details += f"• Code Block {i+1}: {code.get('tag', 'unknown')} "
-                content_details += f"({code.get('language', 'no language specified')})\n"
+            for i, code in enumerate(islice(code_blocks, 5)):
+                parts.append(f"• Code Block {i+1}: {code.get('tag', 'unknown')} ")
+                parts.append(f"({code.get('language', 'no language specified')})\n")
         else:
-            content_details += "• No code blocks found\n"
+            parts.append("• No code blocks found\n")
         
-        content_details += f"""
+        parts.append(f"""
 💬 QUOTES FOUND: {len(content_data.get('quotes', []))}
-"""
+""")
         
-        self.content_text.delete(1.0, tk.END)
-        self.content_text.insert(1.0, content_details)
+        self.set_text(self.content_text, "".join(parts))
         
     def display_links_analysis(self):
         """Display links analysis"""
+        self.ensure_tab_built(self.links_frame)
         if not self.full_data or 'links' not in self.full_data:
             return
             
         links = self.full_data['links']
         
-        # Clear previous links
-        for item in self.links_tree.get_children():
-            self.links_tree.delete(item)
-        
         # Update summary
-        internal_count = sum(1 for link in links if not link.get('is_external', False))
-        external_count = sum(1 for link in links if link.get('is_external', False))
+        external_count = sum(1 for link in links if link.get('is_external'))
+        internal_count = len(links) - external_count
         
         self.links_summary_label.config(
             text=f"Found {len(links)} total links: {internal_count} internal, {external_count} external"
         )
         
-        # Populate links tree
-        for i, link in enumerate(links[:200]):  # Limit to first 200 links
-            text = link.get('text', 'No text')[:50] + ('...' if len(link.get('text', '')) > 50 else '')
-            url = link.get('url', '')
-            link_type = 'External' if link.get('is_external', False) else 'Internal'
-            target = link.get('target', '_self')
-            title = link.get('title', '')[:30] + ('...' if len(link.get('title', '')) > 30 else '')
-            
-            self.links_tree.insert('', 'end', values=(text, url, link_type, target, title))
+        # Every link is available; only the visible window is rendered
+        self.links_view.set_items(links)
+    
+    @staticmethod
+    def format_link_row(link):
+        """Build the links tree values for one link"""
+        get = link.get
+        text = ellipsize(get('text', 'No text'), 50)
+        url = get('url', '')
+        link_type = 'External' if get('is_external', False) else 'Internal'
+        target = get('target', '_self')
+        title = ellipsize(get('title', ''), 30)
+        
+        return (text, url, link_type, target, title)
     
     def display_images_analysis(self):
         """Display images analysis"""
+        self.ensure_tab_built(self.images_frame)
         if not self.full_data or 'images' not in self.full_data:
             return
             
         images = self.full_data['images']
         
-        # Clear previous images
-        for item in self.images_tree.get_children():
-            self.images_tree.delete(item)
-        
         # Update summary
-        images_with_alt = sum(1 for img in images if img.get('alt', '').strip())
+        images_with_alt = sum(1 for img in images if (img.get('alt') or '').strip())
         images_without_alt = len(images) - images_with_alt
         
         self.images_summary_label.config(
             text=f"Found {len(images)} images: {images_with_alt} with alt text, {images_without_alt} without"
         )
         
-        # Populate images tree
-        for img in images[:100]:  # Limit to first 100 images
-            alt_text = img.get('alt', 'No alt text')[:40] + ('...' if len(img.get('alt', '')) > 40 else '')
-            src = img.get('src', '')
-            title = img.get('title', '')[:30] + ('...' if len(img.get('title', '')) > 30 else '')
-            
-            dimensions = ''
-            if img.get('width') or img.get('height'):
-                dimensions = f"{img.get('width', '?')} x {img.get('height', '?')}"
-            
-            loading = img.get('loading', 'eager')
-            
-            self.images_tree.insert('', 'end', values=(alt_text, src, title, dimensions, loading))
+        # Every image is available; only the visible window is rendered
+        self.images_view.set_items(images)
+    
+    @staticmethod
+    def format_image_row(img):
+        """Build the images tree values for one image"""
+        get = img.get
+        alt_text = ellipsize(get('alt', 'No alt text'), 40)
+        src = get('src', '')
+        title = ellipsize(get('title', ''), 30)
+        
+        dimensions = ''
+        if get('width') or get('height'):
+            dimensions = f"{get('width', '?')} x {get('height', '?')}"
+        
+        loading = get('loading', 'eager')
+        
+        return (alt_text, src, title, dimensions, loading)
+    
+    def set_text(self, widget, text):
+        """Replace the contents of a text widget with one delete and one insert, keeping its state"""
+        state = widget.cget('state')
+        widget.configure(state='normal')
+        widget.delete(1.0, tk.END)
+        widget.insert(1.0, text)
+        widget.configure(state=state)
+    
+    @contextmanager
+    def frozen_tree(self, tree):
+        """Clear a Treeview and hide its columns while the caller inserts rows"""
+        children = tree.get_children()
+        if children:
+            tree.delete(*children)
+        
+        # Hide the columns while inserting so Tk does not lay out cells row by row
+        tree.configure(displaycolumns=())
+        try:
+            yield tree.insert
+        finally:
+            tree.configure(displaycolumns='#all')
     
     def display_tables_analysis(self):
         """Display tables analysis"""
+        self.ensure_tab_built(self.tables_frame)
         if not self.full_data:
             return
             
         tables = self.full_data.get('tables', [])
         table_summaries = self.full_data.get('table_summaries', [])
         
-        tables_info = f"""📊 TABLES ANALYSIS
+        parts = [f"""📊 TABLES ANALYSIS
 {'='*40}
 
 📈 SUMMARY:
 • Total Tables Found: {len(tables)}
 
-"""
+"""]
         
         if table_summaries:
             for i, summary in enumerate(table_summaries):
-                tables_info += f"""
+                parts.append(f"""
 🔍 TABLE {summary.get('table_id', i+1)}:
 • Rows: {summary.get('rows', 0)}
 • Columns: {summary.get('columns', 0)}
@@ -888,121 +1340,117 @@ Language: {seo_data.get('lang', 'Not specified')}
 • Caption: {summary.get('caption', 'None')}
 • Headers: {', '.join(summary.get('headers', []))}
 
-"""
+""")
                 
                 # Show sample data from table
                 if i < len(tables) and tables[i]:
-                    tables_info += "📋 SAMPLE DATA (First 3 rows):\n"
-                    sample_rows = tables[i][:3]
-                    for row_idx, row in enumerate(sample_rows):
-                        tables_info += f"Row {row_idx + 1}: {str(row)[:100]}...\n"
-                    tables_info += "\n"
+                    parts.append("📋 SAMPLE DATA (First 3 rows):\n")
+                    for row_idx, row in enumerate(islice(tables[i], 3)):
+                        parts.append(f"Row {row_idx + 1}: {str(row)[:100]}...\n")
+                    parts.append("\n")
         else:
-            tables_info += "No tables found on this page.\n"
+            parts.append("No tables found on this page.\n")
         
-        self.tables_text.delete(1.0, tk.END)
-        self.tables_text.insert(1.0, tables_info)
+        self.set_text(self.tables_text, "".join(parts))
     
     def display_structured_data(self):
         """Display structured data analysis"""
+        self.ensure_tab_built(self.structured_frame)
         if not self.full_data or 'structured_data' not in self.full_data:
             return
             
         structured = self.full_data['structured_data']
+        json_ld = structured.get('json_ld', [])
+        microdata = structured.get('microdata', [])
+        meta_tags = structured.get('meta_tags', [])
+        contact_info = structured.get('contact_info') or {}
+        emails = contact_info.get('emails', [])
+        phones = contact_info.get('phones', [])
         
-        structured_info = f"""🏗️ STRUCTURED DATA ANALYSIS
+        parts = [f"""🏗️ STRUCTURED DATA ANALYSIS
 {'='*50}
 
 📋 JSON-LD STRUCTURED DATA:
-• Found {len(structured.get('json_ld', []))} JSON-LD blocks
-"""
+• Found {len(json_ld)} JSON-LD blocks
+"""]
         
-        json_ld = structured.get('json_ld', [])
-        for i, ld in enumerate(json_ld[:3]):  # Show first 3
-            structured_info += f"\n📄 JSON-LD Block {i+1}:\n"
-            structured_info += json.dumps(ld, indent=2, ensure_ascii=False)[:500] + "...\n"
+        for i, ld in enumerate(islice(json_ld, 3)):  # Show first 3
+            parts.append(f"\n📄 JSON-LD Block {i+1}:\n")
+            parts.append(json_dumps_truncated(ld, 500)[0] + "...\n")
         
-        structured_info += f"""
+        parts.append(f"""
 🏷️ MICRODATA:
-• Found {len(structured.get('microdata', []))} microdata items
-"""
+• Found {len(microdata)} microdata items
+""")
         
-        microdata = structured.get('microdata', [])
-        for i, md in enumerate(microdata[:5]):
-            structured_info += f"\n📋 Microdata Item {i+1}:\n"
-            structured_info += f"  Type: {md.get('itemtype', 'N/A')}\n"
-            structured_info += f"  Properties: {len(md.get('properties', {}))}\n"
-            for prop, value in list(md.get('properties', {}).items())[:3]:
-                structured_info += f"    {prop}: {str(value)[:50]}...\n"
-        
-        structured_info += f"""
+        for i, md in enumerate(islice(microdata, 5)):
+            parts.append(f"\n📋 Microdata Item {i+1}:\n")
+            parts.append(f"  Type: {md.get('itemtype', 'N/A')}\n")
+            parts.append(f"  Properties: {len(md.get('properties', {}))}\n")
+            for prop, value in islice(md.get('properties', {}).items(), 3):
+                parts.append(f"    {prop}: {str(value)[:50]}...\n")
+        
+        parts.append(f"""
 🏷️ META TAGS:
-• Total Meta Tags: {len(structured.get('meta_tags', []))}
-"""
+• Total Meta Tags: {len(meta_tags)}
+""")
         
         # Show important meta tags
-        meta_tags = structured.get('meta_tags', [])
         important_meta = ['viewport', 'charset', 'author', 'generator', 'theme-color']
         for meta in meta_tags:
             if any(imp in meta.get('name', '').lower() for imp in important_meta):
-                structured_info += f"  {meta.get('name', 'N/A')}: {meta.get('content', 'N/A')[:50]}...\n"
+                parts.append(f"  {meta.get('name', 'N/A')}: {meta.get('content', 'N/A')[:50]}...\n")
         
-        structured_info += f"""
+        parts.append(f"""
 📱 SOCIAL MEDIA METADATA:
-"""
+""")
         
         social_media = structured.get('social_media', {})
         for key, value in social_media.items():
             if value:
-                structured_info += f"  {key}: {value[:60]}{'...' if len(value) > 60 else ''}\n"
+                parts.append(f"  {key}: {ellipsize(value, 60)}\n")
         
-        structured_info += f"""
+        parts.append(f"""
 📞 CONTACT INFORMATION:
-• Emails Found: {len(structured.get('contact_info', {}).get('emails', []))}
-• Phone Numbers Found: {len(structured.get('contact_info', {}).get('phones', []))}
-"""
+• Emails Found: {len(emails)}
+• Phone Numbers Found: {len(phones)}
+""")
         
         # Show first few emails and phones
-        emails = structured.get('contact_info', {}).get('emails', [])[:5]
-        phones = structured.get('contact_info', {}).get('phones', [])[:5]
-        
         if emails:
-            structured_info += "  Emails: " + ", ".join(emails) + "\n"
+            parts.append("  Emails: " + ", ".join(islice(emails, 5)) + "\n")
         if phones:
-            structured_info += "  Phones: " + ", ".join(phones) + "\n"
+            parts.append("  Phones: " + ", ".join(islice(phones, 5)) + "\n")
         
-        self.structured_text.delete(1.0, tk.END)
-        self.structured_text.insert(1.0, structured_info)
+        self.set_text(self.structured_text, "".join(parts))
     
     def display_raw_data(self):
         """Display raw JSON data"""
+        self.ensure_tab_built(self.raw_frame)
         if not self.full_data:
             return
             
-        # Display formatted JSON data
+        # Display the formatted JSON prepared by the scrape worker
+        self.set_text(self.raw_text, self._raw_json_preview)
+    
+    def build_raw_json_preview(self):
+        """Serialize the start of full_data for the raw data tab (runs on the scrape worker)"""
         try:
-            formatted_data = json.dumps(self.full_data, indent=2, ensure_ascii=False)
-            # Limit the size for display
-            if len(formatted_data) > 10000:
-                formatted_data = formatted_data[:10000] + "\n\n... (Data truncated for display. Full data available in downloads)"
-            
-            self.raw_text.delete(1.0, tk.END)
-            self.raw_text.insert(1.0, formatted_data)
+            # Only serialize as much of the payload as the view will show
+            formatted_data, truncated = json_dumps_truncated(self.full_data, 10000)
+            if truncated:
+                formatted_data += "\n\n... (Data truncated for display. Full data available in downloads)"
+            return formatted_data
         except Exception as e:
-            self.raw_text.delete(1.0, tk.END)
-            self.raw_text.insert(1.0, f"Error displaying raw data: {str(e)}")
+            return f"Error displaying raw data: {str(e)}"
     
     def update_download_section(self):
         """Update the download section with available files"""
-        if not self.csv_files:
+        if not self.csv_paths:
             return
             
-        # Clear existing buttons
-        for widget in self.download_buttons_frame.winfo_children():
-            widget.destroy()
-        
         # Update available files label
-        file_count = len(self.csv_files)
+        file_count = len(self.csv_paths)
         self.available_files_label.config(
             text=f"📁 {file_count} data files available for download",
             foreground=self.colors['success']
@@ -1023,13 +1471,14 @@ Language: {seo_data.get('lang', 'Not specified')}
             'full_text_content': '📄 Full Text Content'
         }
         
-        # Create buttons in a grid layout
+        # Lay out buttons in a grid, reusing the button made for a file key by earlier scrapes
         row = 0
         col = 0
         max_cols = 3
         
-        for file_key, csv_content in self.csv_files.items():
-            if csv_content:  # Only create button if content exists
+        for file_key in self.csv_paths:  # Only non-empty files are stored
+            btn = self._dl_buttons.get(file_key)
+            if btn is None:
                 display_name = file_descriptions.get(file_key, file_key.replace('_', ' ').title())
                 
                 # Handle table files
@@ -1039,19 +1488,25 @@ Language: {seo_data.get('lang', 'Not specified')}
                 btn = ttk.Button(
                     self.download_buttons_frame,
                     text=display_name,
-                    command=lambda key=file_key: self.download_individual_file(key),
+                    command=partial(self.download_individual_file, file_key),
                     width=20
                 )
-                btn.grid(row=row, column=col, padx=5, pady=3, sticky=tk.W)
-                
-                col += 1
-                if col >= max_cols:
-                    col = 0
-                    row += 1
+                self._dl_buttons[file_key] = btn
+            btn.grid(row=row, column=col, padx=5, pady=3, sticky=tk.W)
+            
+            col += 1
+            if col >= max_cols:
+                col = 0
+                row += 1
+        
+        # Hide buttons for files this result set does not have
+        for file_key, btn in self._dl_buttons.items():
+            if file_key not in self.csv_paths:
+                btn.grid_remove()
     
     def download_individual_file(self, file_key):
         """Download a specific CSV file"""
-        if file_key not in self.csv_files or not self.csv_files[file_key]:
+        if file_key not in self.csv_paths:
             messagebox.showerror("Error", f"File {file_key} not available")
             return
         
@@ -1066,23 +1521,28 @@ Language: {seo_data.get('lang', 'Not specified')}
             initialfile=default_filename
         )
         
-        if filename:
-            try:
-                with open(filename, 'w', encoding='utf-8') as f:
-                    f.write(self.csv_files[file_key])
-                
-                messagebox.showinfo("Success", f"File saved successfully:\n{filename}")
-                self.update_status(f"✅ Downloaded {file_key}")
-                
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to save file:\n{str(e)}")
+        if filename and file_key in self.csv_paths:  # A scrape may have replaced the files meanwhile
+            self._csv_dir_jobs[self._csv_dir] += 1
+            self.run_in_background(self.copy_file, file_key, self.csv_paths[file_key], filename, self._csv_dir)
+    
+    def copy_file(self, file_key, src_path, filename, csv_dir):
+        """Copy one CSV file to filename; runs off the Tk thread"""
+        try:
+            shutil.copyfile(src_path, filename)
+        except Exception as e:
+            self.post_to_ui(messagebox.showerror, "Error", f"Failed to save file:\n{str(e)}")
+        else:
+            self.post_to_ui(messagebox.showinfo, "Success", f"File saved successfully:\n{filename}")
+            self.post_to_ui(self.update_status, f"✅ Downloaded {file_key}")
+        finally:
+            self.post_to_ui(self.release_csv_dir, csv_dir)
     
     def select_download_folder(self):
         """Select folder for bulk downloads"""
         folder = filedialog.askdirectory(title="Select Download Folder")
         if folder:
-            self.download_folder = folder
-            folder_name = os.path.basename(folder) or folder
+            self.download_folder = Path(folder)
+            folder_name = self.download_folder.name or folder
             self.download_folder_label.config(
                 text=f"📁 {folder_name}",
                 foreground=self.colors['success']
@@ -1090,7 +1550,7 @@ Language: {seo_data.get('lang', 'Not specified')}
     
     def download_all_files(self):
         """Download all available CSV files"""
-        if not self.csv_files:
+        if not self.csv_paths:
             messagebox.showerror("Error", "No files available to download")
             return
         
@@ -1098,30 +1558,44 @@ Language: {seo_data.get('lang', 'Not specified')}
             messagebox.showwarning("Warning", "Please select a download folder first")
             return
         
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        jobs = [(f"{file_key}_{timestamp}.csv", src_path)
+                for file_key, src_path in self.csv_paths.items()]
+        
+        # Copy on worker threads so the window stays responsive during bulk saves
+        self.download_all_button.config(state=tk.DISABLED)
+        self.update_status(f"💾 Saving {len(jobs)} files...")
+        self._csv_dir_jobs[self._csv_dir] += 1
+        self.run_in_background(self.copy_files_to_folder, self.download_folder, jobs, self._csv_dir)
+    
+    def copy_files_to_folder(self, folder, jobs, csv_dir):
+        """Copy (filename, source path) jobs into folder in parallel; runs off the Tk thread"""
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            saved_files = []
+            # ThreadPool workers are daemon threads, so closing the window never waits on a copy
+            with ThreadPool(4) as pool:
+                copies = pool.imap_unordered(lambda job: shutil.copyfile(job[1], folder / job[0]), jobs)
+                for done, _ in enumerate(copies, 1):
+                    self.post_to_ui(self.update_status, f"💾 Saved {done}/{len(jobs)} files")
             
-            for file_key, csv_content in self.csv_files.items():
-                if csv_content:
-                    filename = f"{file_key}_{timestamp}.csv"
-                    filepath = os.path.join(self.download_folder, filename)
-                    
-                    with open(filepath, 'w', encoding='utf-8') as f:
-                        f.write(csv_content)
-                    saved_files.append(filename)
-            
-            messagebox.showinfo(
-                "Success", 
-                f"Successfully downloaded {len(saved_files)} files to:\n{self.download_folder}\n\n" +
-                f"Files saved:\n" + "\n".join(saved_files[:10]) + 
-                (f"\n... and {len(saved_files) - 10} more" if len(saved_files) > 10 else "")
-            )
-            
-            self.update_status(f"✅ Downloaded all {len(saved_files)} files")
+            saved_files = [filename for filename, _ in jobs]
+            self.post_to_ui(self.show_download_summary, folder, saved_files)
             
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to download files:\n{str(e)}")
+            self.post_to_ui(messagebox.showerror, "Error", f"Failed to download files:\n{str(e)}")
+        finally:
+            self.post_to_ui(self.release_csv_dir, csv_dir)
+            self.post_to_ui(self.download_all_button.config, {'state': tk.NORMAL})
+    
+    def show_download_summary(self, folder, saved_files):
+        """Tell the user which files a bulk download saved"""
+        messagebox.showinfo(
+            "Success", 
+            f"Successfully downloaded {len(saved_files)} files to:\n{folder}\n\n" +
+            f"Files saved:\n" + "\n".join(saved_files[:10]) + 
+            (f"\n... and {len(saved_files) - 10} more" if len(saved_files) > 10 else "")
+        )
+        
+        self.update_status(f"✅ Downloaded all {len(saved_files)} files")
     
     def analyze_results(self):
         """Open detailed analysis window"""
@@ -1151,125 +1625,80 @@ Language: {seo_data.get('lang', 'Not specified')}
         ttk.Button(analysis_window, text="Close", command=analysis_window.destroy).pack(pady=10)
     
     def generate_detailed_analysis(self):
-        """Generate detailed website analysis"""
+        """Generate detailed website analysis (cached until the data changes)"""
+        if self._analysis_cache is not None:
+            return self._analysis_cache
+        
         data = self.scraped_data
         seo_summary = data.get('seo_summary', {})
         
-        analysis = f"""🔍 COMPREHENSIVE WEBSITE ANALYSIS REPORT
+        parts = [f"""🔍 COMPREHENSIVE WEBSITE ANALYSIS REPORT
 {'='*60}
 
 🌐 WEBSITE OVERVIEW:
 URL: {data.get('url', 'N/A')}
 Title: {data.get('title', 'N/A')}
-Page Size: {data.get('page_size_bytes', 0):,} bytes
+Page Size: {data.get('page_size_bytes', 0):,} bytes{' (truncated)' if data.get('page_truncated') else ''}
 
 📊 CONTENT QUALITY SCORE:
-"""
-        
-        # Calculate quality score
-        score = 0
-        max_score = 100
-        
-        # Title score (10 points)
-        title_length = seo_summary.get('title_length', 0)
-        if 30 <= title_length <= 60:
-            score += 10
-            analysis += "✅ Title length optimal (10/10)\n"
-        elif title_length > 0:
-            score += 5
-            analysis += "⚠️ Title length suboptimal (5/10)\n"
-        else:
-            analysis += "❌ Missing title (0/10)\n"
-        
-        # Description score (10 points)
-        desc_length = seo_summary.get('description_length', 0)
-        if 120 <= desc_length <= 160:
-            score += 10
-            analysis += "✅ Description length optimal (10/10)\n"
-        elif desc_length > 0:
-            score += 5
-            analysis += "⚠️ Description length suboptimal (5/10)\n"
-        else:
-            analysis += "❌ Missing description (0/10)\n"
+"""]
         
-        # Heading structure score (20 points)
+        # Gather every rubric input once
         heading_hierarchy = data.get('heading_hierarchy', {})
-        h1_count = heading_hierarchy.get('h1', 0)
-        if h1_count == 1:
-            score += 10
-            analysis += "✅ Single H1 tag (10/10)\n"
-        elif h1_count > 1:
-            score += 5
-            analysis += "⚠️ Multiple H1 tags (5/10)\n"
-        else:
-            analysis += "❌ No H1 tag (0/10)\n"
-        
-        if heading_hierarchy.get('h2', 0) > 0:
-            score += 10
-            analysis += "✅ H2 tags present (10/10)\n"
-        else:
-            analysis += "❌ No H2 tags (0/10)\n"
-        
-        # Image optimization score (20 points)
         total_images = data.get('total_images', 0)
         images_without_alt = seo_summary.get('images_without_alt', 0)
-        if total_images > 0:
-            alt_ratio = (total_images - images_without_alt) / total_images
-            image_score = int(20 * alt_ratio)
-            score += image_score
-            analysis += f"📊 Image alt text coverage: {alt_ratio:.1%} ({image_score}/20)\n"
-        else:
-            analysis += "ℹ️ No images found (N/A)\n"
+        metrics = {
+            'title_length': seo_summary.get('title_length', 0),
+            'description_length': seo_summary.get('description_length', 0),
+            'h1_count': heading_hierarchy.get('h1', 0),
+            'h2_count': heading_hierarchy.get('h2', 0),
+            'alt_ratio': ((total_images - images_without_alt) / total_images
+                          if total_images > 0 else None),
+            'internal_links': seo_summary.get('internal_links', 0),
+            'external_links': seo_summary.get('external_links', 0),
+            'word_count': data.get('word_count', 0),
+        }
         
-        # Link structure score (20 points)
-        internal_links = seo_summary.get('internal_links', 0)
-        external_links = seo_summary.get('external_links', 0)
+        # Calculate quality score
+        score = 0
+        max_score = 100
         
-        if internal_links > 0:
-            score += 10
-            analysis += "✅ Internal links present (10/10)\n"
-        else:
-            analysis += "❌ No internal links (0/10)\n"
-        
-        if 0 < external_links <= 10:
-            score += 10
-            analysis += "✅ Balanced external links (10/10)\n"
-        elif external_links > 10:
-            score += 5
-            analysis += "⚠️ Many external links (5/10)\n"
-        else:
-            analysis += "❌ No external links (0/10)\n"
-        
-        # Content length score (20 points)
-        word_count = data.get('word_count', 0)
-        if word_count >= 300:
-            score += 20
-            analysis += f"✅ Sufficient content: {word_count:,} words (20/20)\n"
-        elif word_count >= 100:
-            score += 10
-            analysis += f"⚠️ Limited content: {word_count:,} words (10/20)\n"
-        else:
-            analysis += f"❌ Insufficient content: {word_count:,} words (0/20)\n"
+        for metric, rules in QUALITY_RUBRIC:
+            value = metrics[metric]
+            for test, points, message in rules:
+                if test is None or test(value):
+                    if callable(points):
+                        points = points(value)
+                    score += points
+                    parts.append(message.format(value=value, points=points) + "\n")
+                    break
+        
+        title_length = metrics['title_length']
+        desc_length = metrics['description_length']
+        h1_count = metrics['h1_count']
+        h2_count = metrics['h2_count']
+        internal_links = metrics['internal_links']
+        word_count = metrics['word_count']
         
         # Final score
         percentage = (score / max_score) * 100
-        analysis += f"""
+        parts.append(f"""
 🏆 OVERALL QUALITY SCORE: {score}/{max_score} ({percentage:.1f}%)
 
 📋 SCORE INTERPRETATION:
-"""
+""")
         if percentage >= 90:
-            analysis += "🟢 Excellent - Your page is well-optimized!\n"
+            parts.append("🟢 Excellent - Your page is well-optimized!\n")
         elif percentage >= 70:
-            analysis += "🟡 Good - Minor improvements recommended\n"
+            parts.append("🟡 Good - Minor improvements recommended\n")
         elif percentage >= 50:
-            analysis += "🟠 Fair - Several areas need attention\n"
+            parts.append("🟠 Fair - Several areas need attention\n")
         else:
-            analysis += "🔴 Poor - Significant optimization needed\n"
+            parts.append("🔴 Poor - Significant optimization needed\n")
         
-        analysis += f"""
+        parts.append(f"""
 💡 KEY RECOMMENDATIONS:
-"""
+""")
         
         # Add specific recommendations
         recommendations = []
@@ -1289,7 +1718,7 @@ Page Size: {data.get('page_size_bytes', 0):,} bytes
         elif h1_count > 1:
             recommendations.append("• Use only one H1 tag per page")
         
-        if heading_hierarchy.get('h2', 0) == 0:
+        if h2_count == 0:
             recommendations.append("• Add H2 headings for better structure")
         
         if images_without_alt > 0:
@@ -1304,32 +1733,41 @@ Page Size: {data.get('page_size_bytes', 0):,} bytes
         if not recommendations:
             recommendations.append("• Great job! Your page is well-optimized.")
         
-        analysis += "\n".join(recommendations)
+        parts.append("\n".join(recommendations))
         
-        return analysis
+        self._analysis_cache = "".join(parts)
+        return self._analysis_cache
     
     def clear_results(self):
         """Clear all result displays"""
-        # Clear text widgets
-        text_widgets = [
-            self.summary_text, self.seo_text, self.content_text,
-            self.tables_text, self.structured_text, self.raw_text
-        ]
+        self._rendered_tabs.clear()
         
-        for widget in text_widgets:
-            widget.delete(1.0, tk.END)
+        # Clear text widgets (lazy tabs may not have been built yet)
+        text_widgets = ('summary_text', 'seo_text', 'content_text',
+                        'tables_text', 'structured_text', 'raw_text')
+        
+        for name in text_widgets:
+            widget = getattr(self, name, None)
+            if widget is not None:
+                self.set_text(widget, "")
         
         # Clear tree widgets
-        for item in self.content_tree.get_children():
-            self.content_tree.delete(item)
-        for item in self.links_tree.get_children():
-            self.links_tree.delete(item)
-        for item in self.images_tree.get_children():
-            self.images_tree.delete(item)
+        tree = getattr(self, 'content_tree', None)
+        if tree is not None:
+            children = tree.get_children()
+            if children:
+                tree.delete(*children)
+        
+        for name in ('links_view', 'images_view'):
+            view = getattr(self, name, None)
+            if view is not None:
+                view.set_items([])
         
         # Clear summary labels
-        self.links_summary_label.config(text="")
-        self.images_summary_label.config(text="")
+        for name in ('links_summary_label', 'images_summary_label'):
+            label = getattr(self, name, None)
+            if label is not None:
+                label.config(text="")
     
     def clear_all(self):
         """Clear all data and reset GUI"""
@@ -1337,13 +1775,14 @@ Page Size: {data.get('page_size_bytes', 0):,} bytes
         self.url_entry.delete(0, tk.END)
         self.url_entry.insert(0, "https://")
         self.url_status_label.config(text="")
+        self._last_validated_url = None
         
         # Clear results
         self.clear_results()
         
-        # Clear download section
-        for widget in self.download_buttons_frame.winfo_children():
-            widget.destroy()
+        # Clear download section (buttons stay pooled for the next scrape)
+        for btn in self._dl_buttons.values():
+            btn.grid_remove()
         
         self.available_files_label.config(
             text="No files available",
@@ -1369,13 +1808,32 @@ Page Size: {data.get('page_size_bytes', 0):,} bytes
         
         # Clear data
         self.scraped_data = {}
-        self.csv_files = {}
+        self._analysis_cache = None
+        self.csv_paths = {}
+        self.retire_csv_dir()
         self.full_data = {}
+        self._raw_json_preview = ""
         
         self.update_status("🗑️ All data cleared")
         
     def update_progress(self, value, message):
-        """Update progress bar and labels"""
+        """Queue a progress update; pending updates are coalesced into one redraw"""
+        with self._progress_lock:
+            self._pending_progress = (value, message)
+            if self._progress_scheduled or self._closing:
+                return
+            self._progress_scheduled = True
+        try:
+            self.root.after_idle(self._flush_progress)
+        except (RuntimeError, tk.TclError):
+            pass  # The window was destroyed while the worker was running
+    
+    def _flush_progress(self):
+        """Update progress bar and labels with the latest queued value"""
+        with self._progress_lock:
+            value, message = self._pending_progress
+            self._progress_scheduled = False
+        
         self.progress_var.set(value)
         self.progress_label.config(text=message)
         self.status_bar.config(text=message)
@@ -1391,13 +1849,37 @@ Page Size: {data.get('page_size_bytes', 0):,} bytes
             if hasattr(self, 'scraping_start_time'):
                 total_time = (datetime.now() - self.scraping_start_time).total_seconds()
                 self.time_label.config(text=f"✅ Completed in {int(total_time)}s")
-        
-        self.root.update_idletasks()
     
     def update_status(self, message):
-        """Update status bar"""
+        """Update status bar, forcing a redraw at most ~30 times a second"""
         self.status_bar.config(text=message)
-        self.root.update_idletasks()
+        now = time.monotonic()
+        if now - self._last_status_redraw >= STATUS_REDRAW_INTERVAL:
+            self._last_status_redraw = now
+            self.root.update_idletasks()
+    
+    def run_in_background(self, func, *args):
+        """Run func on a daemon thread, so an unfinished request or copy never holds up exit"""
+        threading.Thread(target=func, args=args, daemon=True).start()
+    
+    def post_to_ui(self, func, *args):
+        """Schedule func on the Tk thread from a worker, unless the window is closing"""
+        if self._closing:
+            return
+        try:
+            self.root.after(0, func, *args)
+        except (RuntimeError, tk.TclError):
+            pass  # The window was destroyed between the check and the call
+    
+    def on_close(self):
+        """Stop background work from touching Tk, release the HTTP session and close the window"""
+        self._closing = True
+        self.session.close()
+        
+        # Copies still running are abandoned with their daemon threads, so every directory can go
+        for csv_dir in self._retired_csv_dirs | {self._csv_dir} - {None}:
+            shutil.rmtree(csv_dir, ignore_errors=True)
+        self.root.destroy()
 
 def main():
     """Main function to run the enhanced GUI"""
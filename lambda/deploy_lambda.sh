@@ -16,7 +16,7 @@ source venv/bin/activate
 
 # Install dependencies
 echo "📥 Installing dependencies..."
-pip install -r ../requirements.txt
+pip install -r ../requairments.txt  # The Lambda set; the top-level requirements.txt is for the GUI
 
 # Create deployment package
 echo "📦 Creating deployment package..."
@@ -1,17 +1,272 @@
 import json
+try:
+    import orjson
+except ImportError:  # Fall back to the standard library decoder
+    orjson = None
+try:
+    import boto3
+except ImportError:  # Provided by the Lambda runtime; only needed for S3 staging
+    boto3 = None
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ProtocolError, ReadTimeoutError
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
-import pandas as pd
 import re
 from datetime import datetime
 import logging
 from urllib.parse import urljoin, urlparse
 import base64
+import csv
+import io
+import os
+import time
+import zipfile
+from collections import defaultdict
 
 # Configure logging
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# BeautifulSoup tree builder used for every page; lxml parses in C and is shipped
+# in the Lambda requirements, the pure-Python parser is kept as a fallback for
+# deployments built without it
+try:
+    import lxml
+    PARSER = 'lxml'
+except ImportError:
+    PARSER = 'html.parser'
+
+# Enhanced headers to avoid bot detection
+REQUEST_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'DNT': '1',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Sec-Fetch-User': '?1',
+    'Cache-Control': 'max-age=0',
+    'sec-ch-ua': '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"',
+    'sec-ch-ua-mobile': '?0',
+    'sec-ch-ua-platform': '"Windows"'
+}
+
+# Header overrides sent on successive attempts when a site answers 403; the last
+# set maps every default header to None so only a plain bot identity is sent
+FALLBACK_HEADERS = (
+    {},
+    {'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/16.1 Safari/605.1.15'},
+    {
+        **dict.fromkeys(REQUEST_HEADERS),
+        'User-Agent': 'Mozilla/5.0 (compatible; WebScraper/1.0; +http://example.com/bot)',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8'
+    }
+)
+
+# Backoff retries for rate limiting, server errors and dropped connections; the
+# final response is returned rather than raised so the caller reports its status.
+# Retry-After is ignored because sites may ask for waits longer than the Lambda timeout
+RETRY_POLICY = Retry(
+    total=2,
+    backoff_factor=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset(['GET', 'HEAD']),
+    respect_retry_after_header=False,
+    raise_on_status=False
+)
+
+# Time budget for fetching a page across every header set and retry, leaving the
+# rest of the 30 second Lambda timeout for parsing and building the response
+FETCH_DEADLINE_SECONDS = 20
+FETCH_TIMEOUT_SECONDS = 10
+
+def create_session():
+    """Create the pooled HTTP session shared by every invocation of a warm container"""
+    session = requests.Session()
+    session.headers.update(REQUEST_HEADERS)
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=8, max_retries=RETRY_POLICY)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+# Response headers passed back to the caller, by lowercase name; everything else
+# (cookies in particular) stays out of the payload
+RESPONSE_HEADER_NAMES = (
+    'content-type', 'content-length', 'content-encoding', 'server',
+    'last-modified', 'cache-control', 'expires', 'etag'
+)
+
+# API Gateway response headers, shared by every response since they never change
+API_RESPONSE_HEADERS = {
+    'Content-Type': 'application/json',
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Headers': 'Content-Type',
+    'Access-Control-Allow-Methods': 'POST, OPTIONS'
+}
+
+# Lambda rejects synchronous responses over 6 MB, and API Gateway escapes the body
+# once more inside its envelope, so larger bodies are refused up front with a 413
+MAX_RESPONSE_BODY_BYTES = 5 * 1024 * 1024
+TOO_LARGE_ERROR = {'error': 'Scraped data is too large to return inline. Set CSV_BUCKET to stage results in S3.'}
+
+# Without S3 staging, a page this close to the response limit cannot come back inline
+# (its text is carried in full_data and again in the CSVs), so the 413 is returned
+# before the CSVs and response body are built only to be thrown away
+MAX_INLINE_PAGE_BYTES = MAX_RESPONSE_BODY_BYTES * 4 // 5
+
+# Optional S3 staging for the results: when CSV_BUCKET is set the full data and CSV
+# files are uploaded there and the response carries presigned download links instead
+CSV_BUCKET = os.environ.get('CSV_BUCKET')
+CSV_URL_EXPIRY_SECONDS = 3600
+S3_CLIENT = boto3.client('s3') if CSV_BUCKET and boto3 is not None else None
+
+# Largest page body read from the network; anything beyond is dropped before parsing
+MAX_PAGE_BYTES = 5 * 1024 * 1024
+
+# Created at import so keep-alive connections survive across warm invocations;
+# per-attempt header changes are passed to get() and never stored on it
+SESSION = create_session()
+
+def read_page_body(response, deadline=None, limit=MAX_PAGE_BYTES):
+    """Read a streamed response body, returning it and whether the limit or deadline cut it short"""
+    body = bytearray()
+    truncated = False
+    try:
+        # read1 returns whatever has arrived instead of waiting for a full chunk,
+        # so a server dripping bytes cannot hold the read past the deadline
+        while True:
+            chunk = response.raw.read1(64 * 1024, decode_content=True)
+            if not chunk:
+                break
+            body.extend(chunk)
+            if len(body) >= limit:
+                logger.warning(f"Page body exceeds {limit} bytes, truncating")
+                del body[limit:]
+                truncated = True
+                break
+            if deadline is not None and time.monotonic() > deadline:
+                logger.warning(f"Fetch time budget used up after {len(body)} bytes, truncating")
+                truncated = True
+                break
+    # Raised as requests' own errors, as iter_content would, so callers report a fetch failure
+    except ReadTimeoutError as e:
+        raise requests.exceptions.ConnectionError(e)
+    except ProtocolError as e:
+        raise requests.exceptions.ChunkedEncodingError(e)
+    finally:
+        response.close()
+    return bytes(body), truncated
+
+def json_loads(payload):
+    """Decode JSON, using orjson when it is installed"""
+    if orjson is not None:
+        try:
+            return orjson.loads(payload)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity and integers wider than 64 bits,
+            # which the standard library accepts
+            pass
+    return json.loads(payload)
+
+def json_bytes(payload):
+    """Encode JSON as UTF-8 bytes, using orjson when it is installed"""
+    if orjson is not None:
+        try:
+            # Table records from header-less tables use integer column keys
+            return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            # orjson rejects types and integers the standard library can still encode
+            pass
+    return json.dumps(payload).encode('utf-8')
+
+def json_dumps(payload):
+    """Encode JSON text, using orjson when it is installed"""
+    return json_bytes(payload).decode('utf-8')
+
+# Regular expressions used per element or over the whole page, compiled once
+WHITESPACE_RE = re.compile(r'\s+')
+EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+# An http(s) URL: optional user:password@, a host (or bracketed IPv6 address), optional
+# port, then an optional path, query or fragment with no whitespace; anything else is
+# rejected before fetching
+URL_RE = re.compile(r'https?://(?:[^\s/?#@]*@)?(?:[^\s/?#:@\[\]]+|\[[0-9a-f:.]+\])(?::\d+)?(?:[/?#]\S*)?\Z', re.IGNORECASE)
+# A phone-like run of digit groups that does not start or end inside a longer word or number
+PHONE_RE = re.compile(r'(?<![\w+])(?:\+\d{1,3}[-.\s]?)?\(?\d{1,4}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,9}(?!\w)')
+# Fewest digits a phone match needs; shorter runs are years, prices and counts
+MIN_PHONE_DIGITS = 7
+
+# Typographic quotes mapped to their ASCII equivalents
+QUOTE_TABLE = str.maketrans({'\u201c': '"', '\u201d': '"', '\u2018': "'", '\u2019': "'"})
+
+def keyword_pattern(*keywords):
+    """Compile keywords into one alternation that matches if any of them occurs"""
+    return re.compile('|'.join(re.escape(keyword) for keyword in keywords))
+
+# Page titles that mark a block or error page instead of real content
+ERROR_TITLE_RE = keyword_pattern('403', 'forbidden', 'access denied', 'blocked', 'error')
+
+# URL prefixes used to tell absolute links from site-relative ones
+HTTP_PREFIXES = ('http://', 'https://')
+INTERNAL_LINK_PREFIXES = ('/', '#')
+# Image sources that urljoin would hand back unchanged; protocol-relative '//' still needs the page scheme
+ABSOLUTE_SRC_PREFIXES = ('http://', 'https://', 'data:')
+
+HEADING_TAGS = ('h1', 'h2', 'h3', 'h4', 'h5', 'h6')
+
+def unique_matches(pattern, text, limit=10, accept=None):
+    """Return up to limit distinct full matches of pattern that accept allows, in page order"""
+    matches = {}
+    for match in pattern.finditer(text):
+        value = match.group()
+        if accept is not None and not accept(value):
+            continue
+        matches[value] = None
+        if len(matches) >= limit:
+            break
+    return list(matches)
+
+def is_phone_number(candidate):
+    """Whether a PHONE_RE match has enough digits to be a phone number"""
+    return sum(char.isdigit() for char in candidate) >= MIN_PHONE_DIGITS
+
+def ellipsize(text, limit):
+    """Cut text to limit characters, marking the cut with '...'"""
+    return text if len(text) <= limit else text[:limit] + '...'
+
+def table_records(rows, columns=None):
+    """Turn ragged table rows into records, dropping columns that are empty in every row"""
+    width = max(map(len, rows), default=0)
+    if columns is None:
+        columns = list(range(width))
+    elif rows and width != len(columns):
+        raise ValueError(f"{len(columns)} columns passed, passed data had {width} columns")
+    padded = [row + [None] * (len(columns) - len(row)) for row in rows]
+    kept = [j for j in range(len(columns)) if any(row[j] is not None for row in padded)]
+    columns = [columns[j] for j in kept]
+    return [dict(zip(columns, [row[j] for j in kept])) for row in padded], columns
+
+def csv_text(rows):
+    """Write dict rows as CSV text, with columns in the order their keys first appear"""
+    fieldnames = list(dict.fromkeys(key for row in rows for key in row))
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fieldnames, lineterminator='\n')
+    writer.writeheader()
+    writer.writerows(rows)
+    return buffer.getvalue()
+
+def index_elements(soup):
+    """Walk the document once, returning all tags in order and grouped by tag name"""
+    elements = soup.find_all(True)
+    by_tag = defaultdict(list)
+    for element in elements:
+        by_tag[element.name].append(element)
+    return elements, by_tag
+
 def clean_and_normalize_text(text):
     """Advanced text cleaning and normalization"""
     if not text:
@@ -29,8 +284,7 @@ def clean_and_normalize_text(text):
     text = re.sub(r'([,;:]){2,}', r'\1', text)
     
     # Normalize quotes
-    text = re.sub(r'[""]', '"', text)
-    text = re.sub(r'['']', "'", text)
+    text = text.translate(QUOTE_TABLE)
     
     # Remove excessive spaces around punctuation
     text = re.sub(r'\s+([.!?,:;])', r'\1', text)
@@ -545,7 +799,7 @@ def calculate_readability_score(avg_sentence_length, avg_word_length, word_count
     
     return normalized_score
 
-def extract_structured_data(soup, url):
+def extract_structured_data(soup, url, page_text=None):
     """Extract structured data including JSON-LD, microdata, and other structured formats"""
     structured_data = {
         'json_ld': [],
@@ -561,7 +815,7 @@ def extract_structured_data(soup, url):
     json_ld_scripts = soup.find_all('script', type='application/ld+json')
     for script in json_ld_scripts:
         try:
-            data = json.loads(script.string)
+            data = json_loads(script.string)
             structured_data['json_ld'].append(data)
         except:
             pass
@@ -635,15 +889,13 @@ def extract_structured_data(soup, url):
     
     # Extract contact information with error handling
     try:
-        page_text = soup.get_text()
-        contact_patterns = {
-            'emails': re.findall(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', page_text),
-            'phones': re.findall(r'(\+\d{1,3}[-.\s]?)?\(?\d{1,4}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,9}', page_text)
+        if page_text is None:
+            page_text = soup.get_text()
+        # Distinct matches only, capped at 10 each
+        structured_data['contact_info'] = {
+            'emails': unique_matches(EMAIL_RE, page_text),
+            'phones': unique_matches(PHONE_RE, page_text, accept=is_phone_number)
         }
-        # Remove duplicates and limit results
-        contact_patterns['emails'] = list(set(contact_patterns['emails']))[:10]
-        contact_patterns['phones'] = list(set(contact_patterns['phones']))[:10]
-        structured_data['contact_info'] = contact_patterns
     except Exception as e:
         logger.warning(f"Error extracting contact information: {str(e)}")
         structured_data['contact_info'] = {'emails': [], 'phones': []}
@@ -709,7 +961,7 @@ def extract_structured_data(soup, url):
     
     return structured_data
 
-def extract_advanced_content(soup):
+def extract_advanced_content(soup, element_index=None):
     """Extract advanced content structures"""
     content_data = {
         'navigation': [],
@@ -719,9 +971,44 @@ def extract_advanced_content(soup):
         'quotes': [],
         'data_attributes': []
     }
+    elements, _ = element_index or index_elements(soup)
+    
+    # Sort every element into the structures below in one pass, in document order.
+    # Breadcrumbs keep one bucket per selector so overlapping matches are reported
+    # once per selector, as the individual CSS queries did
+    nav_elements = []
+    breadcrumb_matches = ([], [], [], [])
+    lists = []
+    code_elements = []
+    quote_elements = []
+    data_elements = []
+    for element in elements:
+        name = element.name
+        if name in ('nav', 'ul', 'ol'):
+            nav_elements.append(element)
+        if name in ('ul', 'ol', 'dl'):
+            if len(lists) < 10:  # Only the first 10 lists are reported
+                lists.append(element)
+        elif name in ('code', 'pre'):
+            code_elements.append(element)
+        elif name in ('blockquote', 'q'):
+            quote_elements.append(element)
+        
+        classes = element.get('class', [])
+        if 'breadcrumb' in ' '.join(classes):
+            breadcrumb_matches[0].append(element)
+        if 'breadcrumb' in element.get('id', ''):
+            breadcrumb_matches[1].append(element)
+        if 'breadcrumbs' in classes:
+            breadcrumb_matches[2].append(element)
+        if name == 'nav' and 'breadcrumb' in element.get('aria-label', '').lower():
+            breadcrumb_matches[3].append(element)
+        
+        # Only the first 20 data-* elements are reported, so stop scanning attributes once we have them
+        if len(data_elements) < 20 and any(key.startswith('data-') for key in element.attrs):
+            data_elements.append(element)
     
     # Extract navigation
-    nav_elements = soup.find_all(['nav', 'ul', 'ol'])
     for nav in nav_elements:
         if nav.name == 'nav' or 'nav' in nav.get('class', []):
             links = nav.find_all('a')
@@ -735,15 +1022,7 @@ def extract_advanced_content(soup):
             content_data['navigation'].append(nav_items)
     
     # Extract breadcrumbs
-    breadcrumb_selectors = [
-        '[class*="breadcrumb"]',
-        '[id*="breadcrumb"]',
-        '.breadcrumbs',
-        'nav[aria-label*="breadcrumb" i]'
-    ]
-    
-    for selector in breadcrumb_selectors:
-        breadcrumbs = soup.select(selector)
+    for breadcrumbs in breadcrumb_matches:
         for breadcrumb in breadcrumbs:
             links = breadcrumb.find_all('a')
             breadcrumb_items = []
@@ -756,21 +1035,22 @@ def extract_advanced_content(soup):
                 content_data['breadcrumbs'].append(breadcrumb_items)
     
     # Extract lists
-    lists = soup.find_all(['ul', 'ol', 'dl'])
-    for list_elem in lists[:10]:  # Limit to first 10 lists
-        list_items = []
-        if list_elem.name in ['ul', 'ol']:
-            items = list_elem.find_all('li')
-            for item in items:
-                list_items.append(item.get_text().strip())
-        else:  # dl (description list)
-            dts = list_elem.find_all('dt')
-            dds = list_elem.find_all('dd')
-            for dt, dd in zip(dts, dds):
-                list_items.append({
-                    'term': dt.get_text().strip(),
-                    'description': dd.get_text().strip()
-                })
+    for list_elem in lists:
+        if list_elem.name == 'dl':
+            # Pair each description with the term before it, so a term with several
+            # descriptions keeps all of them and a stray leading dd is skipped
+            list_items = []
+            term = None
+            for child in list_elem.find_all(['dt', 'dd']):
+                if child.name == 'dt':
+                    term = child.get_text().strip()
+                elif term is not None:
+                    list_items.append({
+                        'term': term,
+                        'description': child.get_text().strip()
+                    })
+        else:
+            list_items = [item.get_text().strip() for item in list_elem.find_all('li')]
         
         if list_items:
             content_data['lists'].append({
@@ -779,7 +1059,6 @@ def extract_advanced_content(soup):
             })
     
     # Extract code blocks
-    code_elements = soup.find_all(['code', 'pre'])
     for code in code_elements[:10]:  # Limit to first 10 code blocks
         content_data['code_blocks'].append({
             'tag': code.name,
@@ -788,7 +1067,6 @@ def extract_advanced_content(soup):
         })
     
     # Extract quotes
-    quote_elements = soup.find_all(['blockquote', 'q'])
     for quote in quote_elements:
         content_data['quotes'].append({
             'text': quote.get_text().strip(),
@@ -797,19 +1075,16 @@ def extract_advanced_content(soup):
         })
     
     # Extract elements with data attributes
-    data_elements = soup.find_all(attrs=lambda x: x and any(key.startswith('data-') for key in x))
-    for elem in data_elements[:20]:  # Limit to first 20 elements
-        data_attrs = {k: v for k, v in elem.attrs.items() if k.startswith('data-')}
-        if data_attrs:
-            content_data['data_attributes'].append({
-                'tag': elem.name,
-                'text': elem.get_text().strip()[:100] + '...' if len(elem.get_text().strip()) > 100 else elem.get_text().strip(),
-                'data_attributes': data_attrs
-            })
+    for elem in data_elements:
+        content_data['data_attributes'].append({
+            'tag': elem.name,
+            'text': ellipsize(elem.get_text().strip(), 100),
+            'data_attributes': {k: v for k, v in elem.attrs.items() if k.startswith('data-')}
+        })
     
     return content_data
 
-def extract_seo_data(soup):
+def extract_seo_data(soup, element_index=None):
     """Extract SEO-related data"""
     seo_data = {
         'title_tag': '',
@@ -827,58 +1102,68 @@ def extract_seo_data(soup):
         'page_load_hints': []
     }
     
+    _, by_tag = element_index or index_elements(soup)
+    
+    # Meta tags by name, first occurrence wins as with soup.find
+    meta_by_name = {}
+    for meta in by_tag.get('meta', []):
+        meta_by_name.setdefault(meta.get('name'), meta)
+    
+    # Link tags by rel value, in document order
+    links_by_rel = defaultdict(list)
+    for link in by_tag.get('link', []):
+        for rel in link.get('rel') or []:
+            links_by_rel[rel].append(link)
+    
     # Basic SEO tags
-    title = soup.find('title')
-    seo_data['title_tag'] = title.get_text().strip() if title else ''
+    titles = by_tag.get('title')
+    seo_data['title_tag'] = titles[0].get_text().strip() if titles else ''
     
-    meta_desc = soup.find('meta', attrs={'name': 'description'})
+    meta_desc = meta_by_name.get('description')
     seo_data['meta_description'] = meta_desc.get('content', '') if meta_desc else ''
     
-    meta_keywords = soup.find('meta', attrs={'name': 'keywords'})
+    meta_keywords = meta_by_name.get('keywords')
     seo_data['meta_keywords'] = meta_keywords.get('content', '') if meta_keywords else ''
     
-    canonical = soup.find('link', rel='canonical')
-    seo_data['canonical_url'] = canonical.get('href', '') if canonical else ''
+    canonical = links_by_rel['canonical']
+    seo_data['canonical_url'] = canonical[0].get('href', '') if canonical else ''
     
-    robots = soup.find('meta', attrs={'name': 'robots'})
+    robots = meta_by_name.get('robots')
     seo_data['robots'] = robots.get('content', '') if robots else ''
     
     # Language attributes
-    html = soup.find('html')
-    seo_data['lang'] = html.get('lang', '') if html else ''
+    html = by_tag.get('html')
+    seo_data['lang'] = html[0].get('lang', '') if html else ''
     
     # Hreflang
-    hreflang_links = soup.find_all('link', rel='alternate', hreflang=True)
-    for link in hreflang_links:
-        seo_data['hreflang'].append({
-            'hreflang': link.get('hreflang'),
-            'href': link.get('href')
-        })
+    for link in links_by_rel['alternate']:
+        if link.get('hreflang') is not None:
+            seo_data['hreflang'].append({
+                'hreflang': link.get('hreflang'),
+                'href': link.get('href')
+            })
     
     # Heading structure analysis
-    for level in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
-        headings = soup.find_all(level)
-        seo_data['heading_structure'][level] = len(headings)
+    for level in HEADING_TAGS:
+        seo_data['heading_structure'][level] = len(by_tag.get(level, []))
     
     # Link analysis
-    links = soup.find_all('a', href=True)
-    for link in links:
-        href = link.get('href', '')
-        if href.startswith(('http://', 'https://')):
+    for link in by_tag.get('a', []):
+        href = link.get('href')
+        if href is None:
+            continue
+        if href.startswith(HTTP_PREFIXES):
             seo_data['external_links'] += 1
-        elif href.startswith(('/', '#')):
+        elif href.startswith(INTERNAL_LINK_PREFIXES):
             seo_data['internal_links'] += 1
     
     # Image analysis
-    images = soup.find_all('img')
-    seo_data['images_without_alt'] = len([img for img in images if not img.get('alt')])
+    seo_data['images_without_alt'] = sum(1 for img in by_tag.get('img', []) if not img.get('alt'))
     
     # Performance hints
-    preload_links = soup.find_all('link', rel='preload')
-    prefetch_links = soup.find_all('link', rel='prefetch')
     seo_data['page_load_hints'] = {
-        'preload': len(preload_links),
-        'prefetch': len(prefetch_links)
+        'preload': len(links_by_rel['preload']),
+        'prefetch': len(links_by_rel['prefetch'])
     }
     
     return seo_data
@@ -886,100 +1171,64 @@ def extract_seo_data(soup):
 def extract_data_from_url(url):
     """Extract comprehensive structured data from a given URL"""
     try:
-        # Enhanced headers to avoid bot detection
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'none',
-            'Sec-Fetch-User': '?1',
-            'Cache-Control': 'max-age=0',
-            'sec-ch-ua': '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"',
-            'sec-ch-ua-mobile': '?0',
-            'sec-ch-ua-platform': '"Windows"'
-        }
-        
-        # Create a session for better handling
-        session = requests.Session()
-        session.headers.update(headers)
-        
-        # Add delay to avoid rate limiting
-        import time
-        time.sleep(1)
-        
-        # Try multiple approaches if first fails
+        # Try each header set in turn while the site keeps answering 403;
+        # transient 429/5xx responses are retried by the session's adapter
         response = None
         error_messages = []
-        
-        # Attempt 1: Standard request
-        try:
-            response = session.get(url, timeout=30, allow_redirects=True)
-            response.raise_for_status()
-        except requests.exceptions.HTTPError as e:
-            error_messages.append(f"HTTP Error: {e}")
-            
-            # Attempt 2: Try with different User-Agent
-            if response and response.status_code == 403:
+        deadline = time.monotonic() + FETCH_DEADLINE_SECONDS
+        for attempt, attempt_headers in enumerate(FALLBACK_HEADERS, 1):
+            # Split what is left of the budget over the adapter's tries for this header set
+            remaining = deadline - time.monotonic()
+            if remaining <= 1:
+                error_messages.append(f"Attempt {attempt} skipped: fetch time budget used up")
+                break
+            if response is not None:
                 logger.info("403 error, trying with different User-Agent")
-                session.headers.update({
-                    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/16.1 Safari/605.1.15'
-                })
-                try:
-                    time.sleep(2)  # Longer delay
-                    response = session.get(url, timeout=30)
-                    response.raise_for_status()
-                except requests.exceptions.HTTPError as e2:
-                    error_messages.append(f"Second attempt HTTP Error: {e2}")
-                    
-                    # Attempt 3: Try with minimal headers
-                    session.headers.clear()
-                    session.headers.update({
-                        'User-Agent': 'Mozilla/5.0 (compatible; WebScraper/1.0; +http://example.com/bot)',
-                        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8'
-                    })
-                    try:
-                        time.sleep(3)  # Even longer delay
-                        response = session.get(url, timeout=30)
-                        response.raise_for_status()
-                    except Exception as e3:
-                        error_messages.append(f"Third attempt Error: {e3}")
-                        raise e3
+                response.close()
+            timeout = min(FETCH_TIMEOUT_SECONDS, remaining / (RETRY_POLICY.total + 1))
+            try:
+                response = SESSION.get(url, headers=attempt_headers, timeout=timeout, allow_redirects=True, stream=True)
+                response.raise_for_status()
+                break
+            except requests.exceptions.HTTPError as e:
+                error_messages.append(f"Attempt {attempt} HTTP Error: {e}")
+                if response.status_code != 403:
+                    break
         
         if not response or response.status_code != 200:
+            if response is not None:
+                response.close()
             error_msg = f"Failed to fetch URL after multiple attempts. Errors: {'; '.join(error_messages)}"
             return {'error': error_msg}
         
-        # Check if we got actual HTML content
+        # Check if we got actual HTML content before downloading the body
         content_type = response.headers.get('content-type', '').lower()
         if 'text/html' not in content_type and 'application/xhtml' not in content_type:
+            response.close()
             return {'error': f"Response is not HTML content. Content-Type: {content_type}"}
         
         # Parse with BeautifulSoup
-        soup = BeautifulSoup(response.content, 'html.parser')
+        page_body, page_truncated = read_page_body(response, deadline)
+        soup = BeautifulSoup(page_body, PARSER)
         
-        # Check if we got a valid page (not an error page)
-        if soup.find('title'):
-            title_text = soup.find('title').get_text().strip().lower()
-            if any(error_term in title_text for error_term in ['403', 'forbidden', 'access denied', 'blocked', 'error']):
-                return {'error': f"Page appears to be an error page. Title: {title_text}"}
+        # Walk the document once; the lookups below and the SEO/content
+        # extractors read tags from this index instead of searching the tree
+        element_index = index_elements(soup)
+        _, by_tag = element_index
+        title = by_tag['title'][0] if by_tag.get('title') else None
         
-        # Extract basic information with error handling
-        try:
-            title = soup.find('title')
-            title_text = title.get_text().strip() if title else "No title found"
-        except Exception as e:
-            logger.warning(f"Error extracting title: {str(e)}")
-            title_text = "No title found"
+        # Extract basic information; the title text is read once for both uses
+        title_text = title.get_text().strip() if title else "No title found"
+        
+        # Check if we got a valid page (not an error page)
+        if title:
+            title_lower = title_text.lower()
+            if ERROR_TITLE_RE.search(title_lower):
+                return {'error': f"Page appears to be an error page. Title: {title_lower}"}
         
         # Extract meta description with error handling
         try:
-            meta_desc = soup.find('meta', attrs={'name': 'description'})
+            meta_desc = next((meta for meta in by_tag.get('meta', []) if meta.get('name') == 'description'), None)
             description = meta_desc.get('content', '').strip() if meta_desc else "No description found"
         except Exception as e:
             logger.warning(f"Error extracting description: {str(e)}")
@@ -989,9 +1238,9 @@ def extract_data_from_url(url):
         headings = []
         heading_hierarchy = {}
         try:
-            for level in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
+            for level in HEADING_TAGS:
                 try:
-                    level_headings = soup.find_all(level)
+                    level_headings = by_tag.get(level, [])
                     heading_hierarchy[level] = len(level_headings)
                     for heading in level_headings:
                         try:
@@ -1013,7 +1262,8 @@ def extract_data_from_url(url):
         # Extract all links with enhanced data and error handling
         links = []
         try:
-            all_links = soup.find_all('a', href=True)
+            page_netloc = urlparse(url).netloc
+            all_links = [link for link in by_tag.get('a', []) if link.get('href') is not None]
             for link in all_links[:500]:  # Limit to 500 links
                 try:
                     link_href = str(link['href'])
@@ -1024,7 +1274,7 @@ def extract_data_from_url(url):
                         'target': str(link.get('target', '')),
                         'rel': ' '.join(link.get('rel', [])),
                         'class': ' '.join(link.get('class', [])),
-                        'is_external': link_href.startswith(('http://', 'https://')) and urlparse(url).netloc not in link_href
+                        'is_external': link_href.startswith(HTTP_PREFIXES) and page_netloc not in link_href
                     }
                     links.append(link_data)
                 except Exception as e:
@@ -1036,14 +1286,15 @@ def extract_data_from_url(url):
         # Extract all images with enhanced data and error handling
         images = []
         try:
-            all_images = soup.find_all('img')
+            all_images = by_tag.get('img', [])
             for img in all_images[:200]:  # Limit to 200 images
                 try:
                     img_src = img.get('src', img.get('data-src', ''))
                     if img_src:
+                        img_src = str(img_src)
                         img_data = {
                             'alt': str(img.get('alt', '')),
-                            'src': urljoin(url, str(img_src)),
+                            'src': img_src if img_src.startswith(ABSOLUTE_SRC_PREFIXES) else urljoin(url, img_src),
                             'title': str(img.get('title', '')),
                             'width': str(img.get('width', '')),
                             'height': str(img.get('height', '')),
@@ -1058,9 +1309,10 @@ def extract_data_from_url(url):
             logger.warning(f"Error extracting images: {str(e)}")
         
         # Extract text content (cleaned) with error handling
+        page_text = None
         try:
-            text_content = soup.get_text()
-            text_content = re.sub(r'\s+', ' ', text_content).strip()
+            page_text = soup.get_text()
+            text_content = WHITESPACE_RE.sub(' ', page_text).strip()
         except Exception as e:
             logger.warning(f"Error extracting text content: {str(e)}")
             text_content = "Error extracting text content"
@@ -1069,27 +1321,37 @@ def extract_data_from_url(url):
         tables = []
         table_summaries = []
         try:
-            all_tables = soup.find_all('table')
+            all_tables = by_tag.get('table', [])
             for i, table in enumerate(all_tables[:20]):  # Limit to 20 tables
                 try:
                     rows = []
                     headers = []
                     
-                    # Try to find headers
-                    header_row = table.find('tr')
-                    if header_row and header_row.find('th'):
-                        try:
-                            headers = [th.get_text().strip() for th in header_row.find_all('th')]
-                        except Exception as e:
-                            logger.warning(f"Error extracting table headers: {str(e)}")
+                    # Walk the table once for its rows, first caption and whether it has any header cell
+                    row_elements = []
+                    caption = None
+                    has_th = False
+                    for element in table.find_all(['tr', 'th', 'caption']):
+                        if element.name == 'tr':
+                            row_elements.append(element)
+                        elif element.name == 'th':
+                            has_th = True
+                        elif caption is None:
+                            caption = element
                     
-                    # Extract all rows
-                    for row in table.find_all('tr'):
+                    # Extract all rows, taking headers from the first one
+                    for row_number, row in enumerate(row_elements):
                         try:
+                            row_cells = row.find_all(['td', 'th'])
+                            if row_number == 0:
+                                try:
+                                    headers = [th.get_text().strip() for th in row_cells if th.name == 'th']
+                                except Exception as e:
+                                    logger.warning(f"Error extracting table headers: {str(e)}")
                             cells = []
-                            for cell in row.find_all(['td', 'th']):
+                            for cell in row_cells:
                                 try:
-                                    cell_text = re.sub(r'\s+', ' ', cell.get_text().strip())
+                                    cell_text = WHITESPACE_RE.sub(' ', cell.get_text().strip())
                                     cells.append(cell_text[:100])  # Limit cell text length
                                 except Exception as e:
                                     cells.append("")
@@ -1100,24 +1362,21 @@ def extract_data_from_url(url):
                             continue
                     
                     if rows:
-                        # Create DataFrame
+                        # Build records, dropping all-empty columns
                         try:
                             if headers and len(headers) == len(rows[0]):
-                                df = pd.DataFrame(rows[1:] if table.find('th') else rows, columns=headers)
+                                records, columns = table_records(rows[1:] if has_th else rows, headers)
                             else:
-                                df = pd.DataFrame(rows)
-                            
-                            # Clean DataFrame
-                            df = df.dropna(axis=0, how='all').dropna(axis=1, how='all')
+                                records, columns = table_records(rows)
                             
-                            tables.append(df.to_dict('records'))
+                            tables.append(records)
                             table_summaries.append({
                                 'table_id': i + 1,
-                                'rows': len(df),
-                                'columns': len(df.columns),
-                                'headers': list(df.columns) if headers else [f'Column_{i+1}' for i in range(len(df.columns))],
+                                'rows': len(records),
+                                'columns': len(columns),
+                                'headers': columns if headers else [f'Column_{i+1}' for i in range(len(columns))],
                                 'has_headers': bool(headers),
-                                'caption': table.find('caption').get_text().strip() if table.find('caption') else ''
+                                'caption': caption.get_text().strip() if caption else ''
                             })
                         except Exception as e:
                             logger.warning(f"Error processing table data: {str(e)}")
@@ -1130,19 +1389,19 @@ def extract_data_from_url(url):
         
         # Extract advanced structures with error handling
         try:
-            structured_data = extract_structured_data(soup, url)
+            structured_data = extract_structured_data(soup, url, page_text)
         except Exception as e:
             logger.warning(f"Error extracting structured data: {str(e)}")
             structured_data = {'json_ld': [], 'microdata': [], 'meta_tags': [], 'social_media': {}, 'contact_info': {}, 'forms': [], 'media': []}
         
         try:
-            content_data = extract_advanced_content(soup)
+            content_data = extract_advanced_content(soup, element_index)
         except Exception as e:
             logger.warning(f"Error extracting content data: {str(e)}")
             content_data = {'navigation': [], 'breadcrumbs': [], 'lists': [], 'code_blocks': [], 'quotes': [], 'data_attributes': []}
         
         try:
-            seo_data = extract_seo_data(soup)
+            seo_data = extract_seo_data(soup, element_index)
         except Exception as e:
             logger.warning(f"Error extracting SEO data: {str(e)}")
             seo_data = {}
@@ -1155,8 +1414,9 @@ def extract_data_from_url(url):
             'heading_hierarchy': heading_hierarchy,
             'links': links,
             'images': images,
-            'text_content': text_content[:5000] + '...' if len(text_content) > 5000 else text_content,
-            'word_count': len(text_content.split()),
+            'text_content': ellipsize(text_content, 5000),
+            # text_content has whitespace collapsed to single spaces, so words are spaces + 1
+            'word_count': text_content.count(' ') + 1 if text_content else 0,
             'tables': tables,
             'table_summaries': table_summaries,
             'structured_data': structured_data,
@@ -1164,8 +1424,9 @@ def extract_data_from_url(url):
             'seo_data': seo_data,
             'scraped_at': datetime.now().isoformat(),
             'response_status': response.status_code,
-            'response_headers': dict(response.headers),
-            'page_size_bytes': len(response.content)
+            'response_headers': {name: response.headers[name] for name in RESPONSE_HEADER_NAMES if name in response.headers},
+            'page_size_bytes': len(page_body),
+            'page_truncated': page_truncated  # page_size_bytes then counts only what was read
         }
         
     except requests.exceptions.RequestException as e:
@@ -1186,37 +1447,37 @@ def generate_comprehensive_csv_files(data):
         # 1. Enhanced main summary data
         extraction_stats = data.get('extraction_stats', {})
         main_data = {
-            'URL': [data['url']],
-            'Final_URL': [data.get('final_url', data['url'])],
-            'Title': [data['title']],
-            'Title_Length': [len(data.get('title', ''))],
-            'Description': [data['description']],
-            'Description_Length': [len(data.get('description', ''))],
-            'Word_Count': [data.get('word_count', 0)],
-            'Sentence_Count': [data.get('sentence_count', 0)],
-            'Paragraph_Count': [data.get('paragraph_count', 0)],
-            'Character_Count': [data.get('character_count', 0)],
-            'Reading_Time_Minutes': [data.get('reading_time_minutes', 0)],
-            'Page_Size_Bytes': [data.get('page_size_bytes', 0)],
-            'Load_Time_Seconds': [data.get('load_time_seconds', 0)],
-            'Response_Status': [data.get('response_status', 0)],
-            'Total_Headings': [extraction_stats.get('total_headings', 0)],
-            'Total_Links': [extraction_stats.get('total_links', 0)],
-            'Total_Images': [extraction_stats.get('total_images', 0)],
-            'Total_Tables': [extraction_stats.get('total_tables', 0)],
-            'Internal_Links': [extraction_stats.get('internal_links', 0)],
-            'External_Links': [extraction_stats.get('external_links', 0)],
-            'Images_With_Alt': [extraction_stats.get('images_with_alt', 0)],
-            'Images_Without_Alt': [extraction_stats.get('images_without_alt', 0)],
-            'Scraped_At': [data.get('scraped_at', '')]
+            'URL': data['url'],
+            'Final_URL': data.get('final_url', data['url']),
+            'Title': data['title'],
+            'Title_Length': len(data.get('title', '')),
+            'Description': data['description'],
+            'Description_Length': len(data.get('description', '')),
+            'Word_Count': data.get('word_count', 0),
+            'Sentence_Count': data.get('sentence_count', 0),
+            'Paragraph_Count': data.get('paragraph_count', 0),
+            'Character_Count': data.get('character_count', 0),
+            'Reading_Time_Minutes': data.get('reading_time_minutes', 0),
+            'Page_Size_Bytes': data.get('page_size_bytes', 0),
+            'Load_Time_Seconds': data.get('load_time_seconds', 0),
+            'Response_Status': data.get('response_status', 0),
+            'Total_Headings': extraction_stats.get('total_headings', 0),
+            'Total_Links': extraction_stats.get('total_links', 0),
+            'Total_Images': extraction_stats.get('total_images', 0),
+            'Total_Tables': extraction_stats.get('total_tables', 0),
+            'Internal_Links': extraction_stats.get('internal_links', 0),
+            'External_Links': extraction_stats.get('external_links', 0),
+            'Images_With_Alt': extraction_stats.get('images_with_alt', 0),
+            'Images_Without_Alt': extraction_stats.get('images_without_alt', 0),
+            'Scraped_At': data.get('scraped_at', '')
         }
         
         # Add detailed heading counts
         heading_hierarchy = data.get('heading_hierarchy', {})
-        for level in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
-            main_data[f'{level.upper()}_Count'] = [heading_hierarchy.get(level, 0)]
+        for level in HEADING_TAGS:
+            main_data[f'{level.upper()}_Count'] = heading_hierarchy.get(level, 0)
         
-        csv_files['main_summary'] = pd.DataFrame(main_data).to_csv(index=False)
+        csv_files['main_summary'] = csv_text([main_data])
         
         # 2. Enhanced headings data
         if data.get('headings'):
@@ -1233,7 +1494,7 @@ def generate_comprehensive_csv_files(data):
                     'Has_ID': bool(heading.get('id', '')),
                     'Has_Class': bool(heading.get('class', ''))
                 })
-            csv_files['headings'] = pd.DataFrame(headings_data).to_csv(index=False)
+            csv_files['headings'] = csv_text(headings_data)
         
         # 3. Enhanced links data
         if data.get('links'):
@@ -1254,7 +1515,7 @@ def generate_comprehensive_csv_files(data):
                     'Has_Title': bool(link.get('title', '')),
                     'Opens_New_Tab': link.get('target', '') == '_blank'
                 })
-            csv_files['links'] = pd.DataFrame(links_data).to_csv(index=False)
+            csv_files['links'] = csv_text(links_data)
         
         # 4. Enhanced images data
         if data.get('images'):
@@ -1276,7 +1537,7 @@ def generate_comprehensive_csv_files(data):
                     'Has_Dimensions': bool(img.get('width') or img.get('height')),
                     'Is_Lazy_Loaded': img.get('loading', '') == 'lazy'
                 })
-            csv_files['images'] = pd.DataFrame(images_data).to_csv(index=False)
+            csv_files['images'] = csv_text(images_data)
         
         # 5. Enhanced SEO analysis
         seo_data = data.get('seo_data', {})
@@ -1303,11 +1564,11 @@ def generate_comprehensive_csv_files(data):
             
             # Add heading structure
             heading_structure = seo_data.get('heading_structure', {})
-            for level in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
+            for level in HEADING_TAGS:
                 seo_record[f'{level.upper()}_Count'] = heading_structure.get(level, 0)
             
             seo_analysis_data.append(seo_record)
-            csv_files['seo_analysis'] = pd.DataFrame(seo_analysis_data).to_csv(index=False)
+            csv_files['seo_analysis'] = csv_text(seo_analysis_data)
         
         # 6. Enhanced meta tags
         meta_tags = data.get('structured_data', {}).get('meta_tags', [])
@@ -1322,7 +1583,7 @@ def generate_comprehensive_csv_files(data):
                     'Is_SEO_Related': tag.get('name', '').lower() in ['description', 'keywords', 'robots', 'author', 'viewport'],
                     'Is_Social_Media': tag.get('name', '').lower().startswith(('og:', 'twitter:', 'fb:'))
                 })
-            csv_files['meta_tags'] = pd.DataFrame(meta_data).to_csv(index=False)
+            csv_files['meta_tags'] = csv_text(meta_data)
         
         # 7. Enhanced social media data
         social_media = data.get('structured_data', {}).get('social_media', {})
@@ -1343,7 +1604,7 @@ def generate_comprehensive_csv_files(data):
                         'Is_Description': property_name == 'description'
                     })
             if social_data:
-                csv_files['social_media'] = pd.DataFrame(social_data).to_csv(index=False)
+                csv_files['social_media'] = csv_text(social_data)
         
         # 8. Enhanced contact information
         contact_info = data.get('structured_data', {}).get('contact_info', {})
@@ -1366,7 +1627,7 @@ def generate_comprehensive_csv_files(data):
                     'Is_Generic': False
                 })
             if contact_data:
-                csv_files['contact_info'] = pd.DataFrame(contact_data).to_csv(index=False)
+                csv_files['contact_info'] = csv_text(contact_data)
         
         # 9. Enhanced forms data
         forms = data.get('structured_data', {}).get('forms', [])
@@ -1387,7 +1648,7 @@ def generate_comprehensive_csv_files(data):
                     'Text_Inputs': sum(1 for inp in inputs if inp.get('type') in ['text', 'email', 'tel', 'url']),
                     'Has_Submit': any(inp.get('type') == 'submit' for inp in inputs)
                 })
-            csv_files['forms_summary'] = pd.DataFrame(forms_data).to_csv(index=False)
+            csv_files['forms_summary'] = csv_text(forms_data)
         
         # 10. Enhanced content structure
         lists_data = data.get('content_data', {}).get('lists', [])
@@ -1395,6 +1656,7 @@ def generate_comprehensive_csv_files(data):
             lists_summary = []
             for i, list_item in enumerate(lists_data):
                 items = list_item.get('items', [])
+                item_lengths = [len(str(item)) for item in items]
                 lists_summary.append({
                     'URL': data['url'],
                     'List_ID': i + 1,
@@ -1402,10 +1664,10 @@ def generate_comprehensive_csv_files(data):
                     'Item_Count': len(items),
                     'Is_Ordered': list_item.get('type') == 'ol',
                     'Is_Definition': list_item.get('type') == 'dl',
-                    'Average_Item_Length': sum(len(str(item)) for item in items) / len(items) if items else 0,
-                    'Has_Long_Items': any(len(str(item)) > 100 for item in items)
+                    'Average_Item_Length': sum(item_lengths) / len(item_lengths) if item_lengths else 0.0,
+                    'Has_Long_Items': bool(item_lengths) and max(item_lengths) > 100
                 })
-            csv_files['lists_summary'] = pd.DataFrame(lists_summary).to_csv(index=False)
+            csv_files['lists_summary'] = csv_text(lists_summary)
         
         # 11. Individual table files with enhanced structure
         tables = data.get('tables', [])
@@ -1413,47 +1675,50 @@ def generate_comprehensive_csv_files(data):
         for i, (table, summary) in enumerate(zip(tables, table_summaries)):
             if table:
                 try:
-                    df = pd.DataFrame(table)
-                    if not df.empty:
+                    if any(table):
                         # Add metadata columns
-                        df['Source_URL'] = data['url']
-                        df['Table_ID'] = summary.get('table_id', i + 1)
-                        df['Row_Number'] = range(1, len(df) + 1)
-                        csv_files[f'table_{i+1}'] = df.to_csv(index=False)
+                        table_id = summary.get('table_id', i + 1)
+                        csv_files[f'table_{i+1}'] = csv_text([
+                            {**record, 'Source_URL': data['url'], 'Table_ID': table_id, 'Row_Number': row_number}
+                            for row_number, record in enumerate(table, 1)
+                        ])
                 except Exception as e:
                     logger.warning(f"Error creating CSV for table {i+1}: {str(e)}")
         
         # 12. Enhanced full text content with analysis
         if data.get('text_content'):
             text_data = {
-                'URL': [data['url']],
-                'Full_Text_Content': [data['text_content']],
-                'Word_Count': [data.get('word_count', 0)],
-                'Character_Count': [data.get('character_count', 0)],
-                'Sentence_Count': [data.get('sentence_count', 0)],
-                'Paragraph_Count': [data.get('paragraph_count', 0)],
-                'Reading_Time_Minutes': [data.get('reading_time_minutes', 0)],
-                'Average_Words_Per_Sentence': [data.get('word_count', 0) / max(data.get('sentence_count', 1), 1)],
-                'Average_Sentence_Per_Paragraph': [data.get('sentence_count', 0) / max(data.get('paragraph_count', 1), 1)]
+                'URL': data['url'],
+                'Full_Text_Content': data['text_content'],
+                'Word_Count': data.get('word_count', 0),
+                'Character_Count': data.get('character_count', 0),
+                'Sentence_Count': data.get('sentence_count', 0),
+                'Paragraph_Count': data.get('paragraph_count', 0),
+                'Reading_Time_Minutes': data.get('reading_time_minutes', 0),
+                'Average_Words_Per_Sentence': data.get('word_count', 0) / max(data.get('sentence_count', 1), 1),
+                'Average_Sentence_Per_Paragraph': data.get('sentence_count', 0) / max(data.get('paragraph_count', 1), 1)
             }
-            csv_files['full_text_content'] = pd.DataFrame(text_data).to_csv(index=False)
+            csv_files['full_text_content'] = csv_text([text_data])
         
         # 13. Performance and technical metrics
+        response_headers = data.get('response_headers') or {}
+        final_url = data.get('final_url', data['url'])
+        page_size_bytes = data.get('page_size_bytes', 0)
         performance_data = {
-            'URL': [data['url']],
-            'Final_URL': [data.get('final_url', data['url'])],
-            'Response_Status': [data.get('response_status', 0)],
-            'Page_Size_Bytes': [data.get('page_size_bytes', 0)],
-            'Page_Size_KB': [data.get('page_size_bytes', 0) / 1024],
-            'Load_Time_Seconds': [data.get('load_time_seconds', 0)],
-            'Content_Type': [data.get('response_headers', {}).get('content-type', '')],
-            'Server': [data.get('response_headers', {}).get('server', '')],
-            'Is_Redirected': [data['url'] != data.get('final_url', data['url'])],
-            'Has_Cache_Headers': [bool(data.get('response_headers', {}).get('cache-control') or data.get('response_headers', {}).get('expires'))],
-            'Is_Compressed': ['gzip' in data.get('response_headers', {}).get('content-encoding', '')],
-            'Scraped_At': [data.get('scraped_at', '')]
+            'URL': data['url'],
+            'Final_URL': final_url,
+            'Response_Status': data.get('response_status', 0),
+            'Page_Size_Bytes': page_size_bytes,
+            'Page_Size_KB': page_size_bytes / 1024,
+            'Load_Time_Seconds': data.get('load_time_seconds', 0),
+            'Content_Type': response_headers.get('content-type', ''),
+            'Server': response_headers.get('server', ''),
+            'Is_Redirected': data['url'] != final_url,
+            'Has_Cache_Headers': bool(response_headers.get('cache-control') or response_headers.get('expires')),
+            'Is_Compressed': 'gzip' in response_headers.get('content-encoding', ''),
+            'Scraped_At': data.get('scraped_at', '')
         }
-        csv_files['performance_metrics'] = pd.DataFrame(performance_data).to_csv(index=False)
+        csv_files['performance_metrics'] = csv_text([performance_data])
         
         return {'csv_files': csv_files}
         
@@ -1461,6 +1726,22 @@ def generate_comprehensive_csv_files(data):
         logger.error(f"Error generating CSV files: {str(e)}")
         return {'error': f'Error generating CSV files: {str(e)}'}
 
+def stage_object(key, body, content_type):
+    """Upload one object to CSV_BUCKET and return a presigned download URL for it"""
+    S3_CLIENT.put_object(Bucket=CSV_BUCKET, Key=key, Body=body, ContentType=content_type)
+    return S3_CLIENT.generate_presigned_url(
+        'get_object', Params={'Bucket': CSV_BUCKET, 'Key': key}, ExpiresIn=CSV_URL_EXPIRY_SECONDS
+    )
+
+def csv_archive(csv_files):
+    """Bundle the CSV files into one deflated ZIP archive, in their original order"""
+    buffer = io.BytesIO()
+    # Level 1 gets most of the size reduction on CSV text for a fraction of the CPU
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as archive:
+        for name, csv_content in csv_files.items():
+            archive.writestr(f"{name}.csv", csv_content)
+    return buffer.getvalue()
+
 def calculate_seo_score(seo_data, full_data):
     """Calculate a comprehensive SEO score (0-100)"""
     score = 0
@@ -1527,63 +1808,75 @@ def calculate_seo_score(seo_data, full_data):
         elif internal_links >= 1:
             score += 7
         
-        # Technical SEO (5 points)
-        if seo_data.get('canonical_url'):
-            score += 2.5
-        if seo_data.get('lang'):
-            score += 2.5
+        # Technical SEO (5 points, 2.5 per check); counted apart so score stays an int
+        technical_checks = bool(seo_data.get('canonical_url')) + bool(seo_data.get('lang'))
         
     except Exception as e:
         logger.warning(f"Error calculating SEO score: {str(e)}")
         return 0
     
-    return min(score, max_score)
+    # Add up in half points so the sum is exact; the score is always a float
+    half_points = min(score * 2 + technical_checks * 5, max_score * 2)
+    return half_points / 2
+
+def api_response(status_code, payload):
+    """Build an API Gateway response with a JSON body"""
+    return {
+        'statusCode': status_code,
+        'headers': API_RESPONSE_HEADERS,
+        'body': json_dumps(payload)
+    }
 
 def lambda_handler(event, context):
     """AWS Lambda handler function"""
-    logger.info(f"Received event: {json.dumps(event)}")
+    # The event can carry a large body, so only serialise it when debug logging is on
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Received event: {json_dumps(event)}")
     
     try:
         # Parse the request body
         if 'body' in event:
-            body = json.loads(event['body'])
+            body = json_loads(event['body'])
         else:
             body = event
             
         url = body.get('url')
         if not url:
-            return {
-                'statusCode': 400,
-                'headers': {
-                    'Content-Type': 'application/json',
-                    'Access-Control-Allow-Origin': '*',
-                    'Access-Control-Allow-Headers': 'Content-Type',
-                    'Access-Control-Allow-Methods': 'POST, OPTIONS'
-                },
-                'body': json.dumps({'error': 'URL is required'})
-            }
+            return api_response(400, {'error': 'URL is required'})
         
-        # Validate URL
-        if not url.startswith(('http://', 'https://')):
+        # Validate URL, defaulting to https when no scheme is given
+        url = url.strip()
+        if not URL_RE.match(url):
             url = 'https://' + url
+            if not URL_RE.match(url):
+                return api_response(400, {'error': 'Invalid URL'})
         
         # Extract comprehensive data
         raw_data = extract_data_from_url(url)
         
         if 'error' in raw_data:
-            return {
-                'statusCode': 400,
-                'headers': {
-                    'Content-Type': 'application/json',
-                    'Access-Control-Allow-Origin': '*',
-                    'Access-Control-Allow-Headers': 'Content-Type',
-                    'Access-Control-Allow-Methods': 'POST, OPTIONS'
-                },
-                'body': json.dumps(raw_data)
-            }
+            return api_response(400, raw_data)
+        
+        if S3_CLIENT is None and raw_data.get('page_size_bytes', 0) >= MAX_INLINE_PAGE_BYTES:
+            logger.warning(f"Page {url} is too large to return without S3 staging")
+            return api_response(413, TOO_LARGE_ERROR)
         
         # Generate CSV files
         csv_result = generate_comprehensive_csv_files(raw_data)
+        csv_files = csv_result.get('csv_files', {})
+        
+        # Stage the full data and CSVs in S3 when configured, so the body carries
+        # links instead of serialising the page's text, tables and lists a second time
+        staged_payload = {'full_data': raw_data, 'csv_files': csv_files}
+        if S3_CLIENT is not None:
+            try:
+                prefix = getattr(context, 'aws_request_id', None) or datetime.now().strftime('%Y%m%d%H%M%S%f')
+                staged_payload = {
+                    'full_data_url': stage_object(f"{prefix}/full_data.json", json_bytes(raw_data), 'application/json'),
+                    'csv_archive_url': stage_object(f"{prefix}/csv_files.zip", csv_archive(csv_files), 'application/zip')
+                }
+            except Exception as e:
+                logger.warning(f"Error staging results in S3, returning them inline: {str(e)}")
         
         # Prepare response data (limit size for response)
         response_data = {
@@ -1592,6 +1885,7 @@ def lambda_handler(event, context):
             'description': raw_data['description'],
             'word_count': raw_data.get('word_count', 0),
             'page_size_bytes': raw_data.get('page_size_bytes', 0),
+            'page_truncated': raw_data.get('page_truncated', False),
             'total_headings': len(raw_data.get('headings', [])),
             'total_links': len(raw_data.get('links', [])),
             'total_images': len(raw_data.get('images', [])),
@@ -1605,34 +1899,25 @@ def lambda_handler(event, context):
                 'title_length': len(raw_data.get('seo_data', {}).get('title_tag', '')),
                 'description_length': len(raw_data.get('seo_data', {}).get('meta_description', ''))
             },
-            'available_files': list(csv_result['csv_files'].keys()) if 'csv_files' in csv_result else []
+            'available_files': list(csv_files)
         }
         
+        # Size the encoded bytes; the text body is only decoded for a response that is sent
+        body = json_bytes({
+            'success': True,
+            'data': response_data,
+            **staged_payload  # Full data for detailed analysis, plus the CSV files
+        })
+        if len(body) > MAX_RESPONSE_BODY_BYTES:
+            logger.warning(f"Response body for {url} exceeds {MAX_RESPONSE_BODY_BYTES} bytes")
+            return api_response(413, TOO_LARGE_ERROR)
+        
         return {
             'statusCode': 200,
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': '*',
-                'Access-Control-Allow-Headers': 'Content-Type',
-                'Access-Control-Allow-Methods': 'POST, OPTIONS'
-            },
-            'body': json.dumps({
-                'success': True,
-                'data': response_data,
-                'full_data': raw_data,  # Include full data for detailed analysis
-                'csv_files': csv_result.get('csv_files', {})
-            })
+            'headers': API_RESPONSE_HEADERS,
+            'body': body.decode('utf-8')
         }
         
     except Exception as e:
         logger.error(f"Error in lambda_handler: {str(e)}")
-        return {
-            'statusCode': 500,
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': '*',
-                'Access-Control-Allow-Headers': 'Content-Type',
-                'Access-Control-Allow-Methods': 'POST, OPTIONS'
-            },
-            'body': json.dumps({'error': f'Internal server error: {str(e)}'})
-        }
\ No newline at end of file
+        return api_response(500, {'error': f'Internal server error: {str(e)}'})
\ No newline at end of file
@@ -30,12 +30,18 @@ class WebScraperSetup:
         
         # Install GUI dependencies
         try:
-            subprocess.run([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"], 
-                         check=True, capture_output=True)
+            # Skip pip's version self-check and terminal formatting; progress output is
+            # discarded and only stderr is kept for the failure message
+            subprocess.run([sys.executable, "-m", "pip", "install", "--no-input",
+                            "--disable-pip-version-check", "--no-color", "--progress-bar=off",
+                            "-r", "requirements.txt"],
+                         check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
             print("✅ Dependencies installed successfully")
             return True
         except subprocess.CalledProcessError as e:
             print(f"❌ Failed to install dependencies: {e}")
+            if e.stderr:
+                print(e.stderr.strip())
             return False
             
     def create_directories(self):
@@ -0,0 +1,141 @@
+import unittest
+import sys
+import os
+from unittest import mock
+
+# Add the GUI directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'gui'))
+
+import web_scraper_gui
+from web_scraper_gui import VirtualTreeview
+
+class StubTree:
+    """The slice of the ttk.Treeview API VirtualTreeview uses, without a display"""
+
+    def __init__(self, height=5):
+        self.height = height
+        self.rows = []
+        self.selected = []
+        self.focused = ''
+        self.bindings = {}
+
+    def bind(self, sequence, func):
+        self.bindings[sequence] = func
+
+    def winfo_height(self):
+        return 1  # Unmapped, so the requested height is used
+
+    def cget(self, option):
+        return self.height
+
+    def get_children(self):
+        return tuple(self.rows)
+
+    def delete(self, *iids):
+        self.rows = [iid for iid in self.rows if iid not in iids]
+        self.selected = [iid for iid in self.selected if iid not in iids]
+        if self.focused in iids:
+            self.focused = ''
+
+    def insert(self, parent, index, iid, values):
+        self.rows.insert(index, iid)
+
+    def bbox(self, iid):
+        return ''
+
+    def selection_set(self, iids):
+        self.selected = list(iids)
+
+    def selection(self):
+        return tuple(self.selected)
+
+    def focus(self, iid=None):
+        if iid is None:
+            return self.focused
+        self.focused = iid
+
+class StubScrollbar:
+    def configure(self, **options):
+        pass
+
+    def set(self, first, last):
+        self.position = (first, last)
+
+class TestVirtualTreeview(unittest.TestCase):
+    def setUp(self):
+        self.tree = StubTree(height=5)
+        with mock.patch.object(web_scraper_gui.ttk, 'Style') as style:
+            style.return_value.lookup.return_value = '20'
+            self.view = VirtualTreeview(self.tree, StubScrollbar(), lambda item: (item,))
+        self.view.set_items(list(range(100)))
+
+    def press(self, sequence):
+        return self.tree.bindings[sequence](None)
+
+    def click(self, *iids):
+        """Select rows in the window the way a mouse click does"""
+        self.tree.selection_set(iids)
+        self.tree.focus(iids[-1])
+        self.view.on_select(None)
+
+    def test_down_scrolls_past_the_window_edge(self):
+        # The first press focuses the top row, each later one moves down a row
+        for _ in range(8):
+            self.assertEqual(self.press('<Down>'), 'break')
+        self.assertEqual(self.view.focus_index, 7)
+        self.assertEqual(self.view.selected, {7})
+        self.assertEqual(self.tree.get_children(), ('3', '4', '5', '6', '7'))
+        self.assertEqual(self.tree.selection(), ('7',))
+
+    def test_shift_down_extends_from_the_clicked_row(self):
+        self.click('2')
+        for _ in range(5):
+            self.press('<Shift-Down>')
+        self.assertEqual(self.view.selected, set(range(2, 8)))
+        self.assertEqual(self.view.focus_index, 7)
+        self.assertEqual(sorted(self.tree.selection(), key=int), ['3', '4', '5', '6', '7'])
+
+        # Shrinking back towards the anchor drops rows again
+        self.press('<Shift-Up>')
+        self.assertEqual(self.view.selected, set(range(2, 7)))
+
+    def test_shift_extends_above_the_anchor(self):
+        self.click('4')
+        self.press('<Shift-Up>')
+        self.press('<Shift-Up>')
+        self.assertEqual(self.view.selected, {2, 3, 4})
+
+    def test_shift_end_and_home_span_the_whole_list(self):
+        self.click('1')
+        self.press('<Shift-End>')
+        self.assertEqual(self.view.selected, set(range(1, 100)))
+        self.assertEqual(self.tree.get_children(), ('95', '96', '97', '98', '99'))
+        self.press('<Shift-Home>')
+        self.assertEqual(self.view.selected, {0, 1})
+
+    def test_shift_page_down_extends_by_a_window(self):
+        self.click('0')
+        self.press('<Shift-Next>')
+        self.assertEqual(self.view.selected, set(range(6)))
+
+    def test_plain_key_after_extend_resets_the_selection(self):
+        self.click('2')
+        self.press('<Shift-Down>')
+        self.press('<Down>')
+        self.assertEqual(self.view.selected, {4})
+        self.assertEqual(self.view.anchor_index, 4)
+
+    def test_selection_outside_the_window_survives_scrolling(self):
+        self.click('1', '3')
+        self.view.yview('scroll', 10, 'units')
+        self.assertEqual(self.tree.selection(), ())
+
+        # Tk reports the emptied window selection; rows scrolled away are kept
+        self.view.on_select(None)
+        self.assertEqual(self.view.selected, {1, 3})
+
+        self.view.yview('moveto', 0.0)
+        self.assertEqual(sorted(self.tree.selection(), key=int), ['1', '3'])
+
+if __name__ == '__main__':
+    unittest.main()